@@ -0,0 +1,459 @@
+"""
+Complex-Plane Root-Finding Methods.
+
+This module provides root-finding methods for analytic functions of a complex
+variable x, written with the functions of `cmath` and "I" for the imaginary
+unit (e.g. "x^2 + 1" or "exp(x) - I").
+
+Zeros in a rectangle are counted with the argument principle, from the winding
+of f along the boundary evaluated in one vectorized call, and located by
+subdividing the rectangle until each piece holds a single zero that Newton or
+Müller's method can polish.
+
+The argument principle counts zeros minus poles, so f must be analytic in the
+rectangle: ComplexSolver refuses regions where a divisor of the expression
+vanishes, and the branch cuts of `log` and `sqrt` must stay outside.
+
+Classes:
+    ComplexRootFinderMethods: Contains static methods for complex root-finding.
+    ComplexSolver: Handles the evaluation and solving of complex functions.
+
+Functions:
+    pole_denominators: Lists the subexpressions whose zeros may be poles.
+"""
+
+# Standard Library Imports
+import ast
+import cmath
+import time
+
+# Third-Party Library Imports
+import numpy as np
+
+# Local Imports
+from functions import RootFinderMethods, compile_expression, fold_constant
+from instrumentation import InstrumentedFunction, SolverMetrics
+
+
+def pole_denominators(expr):
+    """
+    Lists the subexpressions whose zeros may be poles of an expression.
+
+    These are the divisors, the bases of powers whose exponent is not a
+    non-negative constant, and the cosines behind `tan`. An expression is
+    analytic wherever none of them vanishes.
+
+    Args:
+        expr (str): The expression, "^" is accepted for powers.
+
+    Returns:
+        list: The source of each distinct denominator.
+    """
+    denominators = []
+    for node in ast.walk(ast.parse(expr.replace("^", "**"), mode="eval")):
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Div):
+            if fold_constant(node.right) is None:
+                denominators.append(ast.unparse(node.right))
+        elif isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+            exponent = fold_constant(node.right)
+            if exponent is None or not exponent.real >= 0 or exponent.imag:
+                denominators.append(ast.unparse(node.left))
+        elif (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == "tan"
+        ):
+            denominators.extend(f"cos({ast.unparse(arg)})" for arg in node.args)
+    return list(dict.fromkeys(denominators))
+
+
+class ComplexRootFinderMethods:
+    """
+    Contains static methods for finding roots in the complex plane.
+
+    Methods:
+        newton: Finds a root using the Newton-Raphson method.
+        muller: Finds a root using Müller's method.
+        count_zeros: Counts the zeros in a rectangle with the argument principle.
+        find_zeros: Locates every zero in a rectangle.
+    """
+
+    @staticmethod
+    def newton(f, z0, tol=1e-10, max_iter=100):
+        """
+        Finds a root using the Newton-Raphson method.
+
+        The central difference used by the real method is also exact to second
+        order for analytic functions, so the same iteration applies.
+
+        Args:
+            f (callable): The complex function to find the root of.
+            z0 (complex): The initial guess.
+            tol (float): The tolerance for |f(z)|.
+            max_iter (int): The maximum number of iterations.
+
+        Returns:
+            tuple: The root and the number of iterations.
+        """
+        return RootFinderMethods.newton_raphson(f, complex(z0), tol, max_iter)
+
+    @staticmethod
+    def muller(f, z0, z1=None, z2=None, tol=1e-10, max_iter=100):
+        """
+        Finds a root using Müller's method.
+
+        A parabola is fitted through the last three iterates and its root
+        closest to the latest one is taken, so real starting points can reach
+        complex roots and no derivative is needed.
+
+        Args:
+            f (callable): The complex function to find the root of.
+            z0 (complex): The first starting point.
+            z1 (complex): The second starting point, defaults to z0 + 0.5.
+            z2 (complex): The third starting point, defaults to z0 + 0.5j.
+            tol (float): The tolerance for the step and for |f(z)|.
+            max_iter (int): The maximum number of iterations.
+
+        Returns:
+            tuple: The root and the number of iterations.
+        """
+        z0 = complex(z0)
+        z1 = z0 + 0.5 if z1 is None else complex(z1)
+        z2 = z0 + 0.5j if z2 is None else complex(z2)
+        f0, f1, f2 = f(z0), f(z1), f(z2)
+        iterations = 0
+        while abs(f2) > tol and iterations < max_iter:
+            h1, h2 = z1 - z0, z2 - z1
+            if h1 == 0 or h2 == 0 or h1 + h2 == 0:
+                raise ValueError("Müller's method needs three distinct points.")
+            d1, d2 = (f1 - f0) / h1, (f2 - f1) / h2
+            a = (d2 - d1) / (h2 + h1)
+            b = a * h2 + d2
+            discriminant = cmath.sqrt(b * b - 4 * a * f2)
+            denominator = b + discriminant
+            if abs(b - discriminant) > abs(denominator):
+                denominator = b - discriminant
+            if denominator == 0:
+                raise ValueError("Müller's method stalled on a flat parabola.")
+            step = -2 * f2 / denominator
+            z0, z1, z2 = z1, z2, z2 + step
+            f0, f1, f2 = f1, f2, f(z2)
+            iterations += 1
+            if abs(step) < tol:
+                break
+        return z2, iterations
+
+    @staticmethod
+    def count_zeros(f, x0, x1, y0, y1, n=256, max_n=65536):
+        """
+        Counts the zeros in a rectangle with the argument principle.
+
+        The number of zeros (with multiplicity) of an analytic f inside the
+        rectangle equals the winding number of f along its boundary. f is
+        evaluated on all boundary points in one vectorized call, and the
+        sampling is doubled until no phase jump between neighbours exceeds
+        pi/4, so the winding cannot be miscounted. Poles wind the other way,
+        so a negative winding is reported as an error.
+
+        Args:
+            f (callable): The vectorized complex function.
+            x0 (float): The left edge.
+            x1 (float): The right edge.
+            y0 (float): The bottom edge.
+            y1 (float): The top edge.
+            n (int): The initial number of points per edge.
+            max_n (int): The maximum number of points per edge.
+
+        Returns:
+            int: The number of zeros inside the rectangle.
+        """
+        corners = np.array(
+            [complex(x0, y0), complex(x1, y0), complex(x1, y1), complex(x0, y1)]
+        )
+        while True:
+            t = np.linspace(0, 1, n, endpoint=False)
+            edges = corners[:, None] + (np.roll(corners, -1) - corners)[:, None] * t
+            values = f(edges.ravel())
+            if not np.all(np.isfinite(values)) or np.any(values == 0):
+                raise ValueError(
+                    "The function has a zero or a pole on the contour. "
+                    "Adjust the region."
+                )
+            phase = np.angle(values)
+            jumps = np.angle(np.exp(1j * (np.roll(phase, -1) - phase)))
+            if np.max(np.abs(jumps)) <= np.pi / 4:
+                winding = int(round(jumps.sum() / (2 * np.pi)))
+                if winding < 0:
+                    raise ValueError(
+                        "The function has poles in the region. Adjust the region."
+                    )
+                return winding
+            if n >= max_n:
+                raise ValueError(
+                    "The function varies too fast on the contour. Adjust the region."
+                )
+            n *= 2
+
+    @staticmethod
+    def find_zeros(f, f_vectorized, x0, x1, y0, y1, tol=1e-10, max_depth=40):
+        """
+        Locates every zero in a rectangle.
+
+        Rectangles are counted and split into quadrants until each holds one
+        zero, which Newton's method (or Müller's, if Newton leaves the piece)
+        polishes from the centre. Pieces that shrink below `tol` while still
+        holding several zeros, or whose quadrant counts do not add up however
+        they are split, are reported as one zero of that multiplicity. f must
+        be analytic in the rectangle, since poles cancel zeros in the counts.
+
+        Args:
+            f (callable): The scalar complex function.
+            f_vectorized (callable): The same function, vectorized.
+            x0 (float): The left edge.
+            x1 (float): The right edge.
+            y0 (float): The bottom edge.
+            y1 (float): The top edge.
+            tol (float): The tolerance for the zeros.
+            max_depth (int): The maximum number of subdivisions.
+
+        Returns:
+            list: The (zero, multiplicity) pairs found.
+        """
+
+        def count(rect):
+            return ComplexRootFinderMethods.count_zeros(f_vectorized, *rect)
+
+        def centre(rect):
+            rx0, rx1, ry0, ry1 = rect
+            return complex((rx0 + rx1) / 2, (ry0 + ry1) / 2)
+
+        def polish(rect):
+            rx0, rx1, ry0, ry1 = rect
+            margin = 1e-9 * max(rx1 - rx0, ry1 - ry0, 1)
+            methods = (ComplexRootFinderMethods.newton, ComplexRootFinderMethods.muller)
+            for method in methods:
+                if method is ComplexRootFinderMethods.muller:
+                    record = getattr(f, "record_fallback", None)
+                    if record:
+                        record("muller")
+                try:
+                    z, _ = method(f, centre(rect), tol=tol)
+                except (ValueError, ZeroDivisionError, OverflowError):
+                    continue
+                inside = (
+                    rx0 - margin <= z.real <= rx1 + margin
+                    and ry0 - margin <= z.imag <= ry1 + margin
+                )
+                if inside and abs(f(z)) <= max(tol, 1e-8):
+                    return z
+            return None
+
+        zeros = []
+        stack = [((x0, x1, y0, y1), count((x0, x1, y0, y1)), 0)]
+        while stack:
+            rect, zeros_inside, depth = stack.pop()
+            if zeros_inside <= 0:
+                continue
+            rx0, rx1, ry0, ry1 = rect
+            size = max(rx1 - rx0, ry1 - ry0)
+            if zeros_inside == 1:
+                z = polish(rect)
+                if z is not None:
+                    zeros.append((z, 1))
+                    continue
+            if size <= tol or depth >= max_depth:
+                zeros.append((centre(rect), zeros_inside))
+                continue
+
+            # Split slightly off-centre, retrying elsewhere if a zero sits on
+            # a cut and the counts of the quadrants do not add up
+            for offset in (0.4972, 0.5331, 0.4617):
+                xm = rx0 + offset * (rx1 - rx0)
+                ym = ry0 + offset * (ry1 - ry0)
+                quadrants = [
+                    (rx0, xm, ry0, ym),
+                    (xm, rx1, ry0, ym),
+                    (rx0, xm, ym, ry1),
+                    (xm, rx1, ym, ry1),
+                ]
+                try:
+                    counts = [count(quadrant) for quadrant in quadrants]
+                except ValueError:
+                    continue
+                if sum(counts) == zeros_inside:
+                    break
+            else:
+                # Near a multiple zero in expanded form the contour values are
+                # round-off, so the cluster is reported as one zero
+                zeros.append((polish(rect) or centre(rect), zeros_inside))
+                continue
+            stack.extend(
+                (quadrant, quadrant_count, depth + 1)
+                for quadrant, quadrant_count in zip(quadrants, counts)
+            )
+        return sorted(zeros, key=lambda zero: (zero[0].real, zero[0].imag))
+
+
+class ComplexSolver:
+    """
+    Handles the evaluation and solving of complex functions.
+
+    Attributes:
+        finder (ComplexRootFinderMethods): An instance of ComplexRootFinderMethods.
+        metrics (SolverMetrics): Metrics accumulated over every solve.
+        last_metrics (SolverMetrics): Metrics of the last solve.
+    """
+
+    def __init__(self):
+        """
+        Initializes the ComplexSolver.
+        """
+        self.finder = ComplexRootFinderMethods()
+        self.metrics = SolverMetrics()
+        self.last_metrics = SolverMetrics()
+
+    def _compile(self, f_str, metrics, vectorized):
+        """
+        Compiles a complex function and wraps it to record its evaluations.
+
+        Args:
+            f_str (str): The function as a string.
+            metrics (SolverMetrics): Where the evaluations are recorded.
+            vectorized (bool): Whether to evaluate with NumPy ufuncs.
+
+        Returns:
+            InstrumentedFunction: The instrumented function.
+        """
+        return InstrumentedFunction(
+            compile_expression(f_str, vectorized=vectorized, complex_values=True),
+            metrics,
+        )
+
+    def _run(self, solve):
+        """
+        Runs a solve, timing it and recording its metrics.
+
+        Args:
+            solve (callable): Called with the metrics of the solve.
+
+        Returns:
+            tuple: The result of `solve` and the computation time.
+        """
+        metrics = self.last_metrics = SolverMetrics()
+        metrics.hooks = self.metrics.hooks
+        start_time = time.perf_counter_ns()
+        result = solve(metrics)
+        solve_time_ns = time.perf_counter_ns() - start_time
+        metrics.count("solves")
+        metrics.add_time("solve_time_ns", solve_time_ns)
+        self.metrics.merge(metrics)
+        metrics.emit("solve", metrics.to_dict())
+        return result, solve_time_ns / 1e9
+
+    def solve(self, f_str, z0, tol, method_name="newton", z1=None, z2=None):
+        """
+        Finds one complex root using the selected method.
+
+        Args:
+            f_str (str): The function as a string.
+            z0 (complex): The initial guess.
+            tol (float): The tolerance for the root.
+            method_name (str): "newton" or "muller".
+            z1 (complex): The second starting point for Müller's method.
+            z2 (complex): The third starting point for Müller's method.
+
+        Returns:
+            tuple: The root, the number of iterations, and the computation time.
+        """
+        if method_name not in ["newton", "muller"]:
+            raise ValueError(f"Invalid method selected: {method_name}")
+
+        def solve(metrics):
+            f = self._compile(f_str, metrics, vectorized=False)
+            if method_name == "newton":
+                root, iterations = self.finder.newton(f, z0, tol)
+            else:
+                root, iterations = self.finder.muller(f, z0, z1, z2, tol)
+            metrics.record_iterations(iterations)
+            return root, iterations
+
+        (root, iterations), computation_time = self._run(solve)
+        return root, iterations, computation_time
+
+    def _check_poles(self, f_str, metrics, x0, x1, y0, y1):
+        """
+        Rejects regions where the function may have poles.
+
+        The zeros of every denominator of the expression are counted in the
+        region. Nested denominators are checked too, so each count is exact
+        once the denominators inside it are known not to vanish.
+
+        Args:
+            f_str (str): The function as a string.
+            metrics (SolverMetrics): Where the evaluations are recorded.
+            x0 (float): The left edge.
+            x1 (float): The right edge.
+            y0 (float): The bottom edge.
+            y1 (float): The top edge.
+        """
+        for denominator in pole_denominators(f_str):
+            d = self._compile(denominator, metrics, vectorized=True)
+            try:
+                vanishes = self.finder.count_zeros(d, x0, x1, y0, y1) != 0
+            except ValueError:
+                vanishes = True
+            if vanishes:
+                raise ValueError(
+                    f"The function may have a pole in the region, where "
+                    f"'{denominator}' vanishes. Adjust the region."
+                )
+
+    def count_zeros(self, f_str, x0, x1, y0, y1):
+        """
+        Counts the zeros of a function in a rectangle.
+
+        The region is rejected if the function may have poles in it.
+
+        Args:
+            f_str (str): The function as a string.
+            x0 (float): The left edge.
+            x1 (float): The right edge.
+            y0 (float): The bottom edge.
+            y1 (float): The top edge.
+
+        Returns:
+            tuple: The number of zeros and the computation time.
+        """
+
+        def solve(metrics):
+            f_vectorized = self._compile(f_str, metrics, vectorized=True)
+            self._check_poles(f_str, metrics, x0, x1, y0, y1)
+            return self.finder.count_zeros(f_vectorized, x0, x1, y0, y1)
+
+        return self._run(solve)
+
+    def find_zeros(self, f_str, x0, x1, y0, y1, tol=1e-10):
+        """
+        Locates every zero of a function in a rectangle.
+
+        The region is rejected if the function may have poles in it.
+
+        Args:
+            f_str (str): The function as a string.
+            x0 (float): The left edge.
+            x1 (float): The right edge.
+            y0 (float): The bottom edge.
+            y1 (float): The top edge.
+            tol (float): The tolerance for the zeros.
+
+        Returns:
+            tuple: The (zero, multiplicity) pairs and the computation time.
+        """
+
+        def solve(metrics):
+            f = self._compile(f_str, metrics, vectorized=False)
+            f_vectorized = self._compile(f_str, metrics, vectorized=True)
+            self._check_poles(f_str, metrics, x0, x1, y0, y1)
+            return self.finder.find_zeros(f, f_vectorized, x0, x1, y0, y1, tol)
+
+        return self._run(solve)
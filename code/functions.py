@@ -5,13 +5,267 @@ This module provides implementations of various root-finding methods.
 
 Classes:
     RootFinderMethods: Contains static methods for root-finding algorithms.
+    VectorizedRootFinderMethods: Array versions of the open root-finding methods.
     FunctionSolver: Handles the evaluation and solving of functions.
+
+Functions:
+    fold_constant: Evaluates a subexpression made only of numeric constants.
+    parse_expression: Parses and validates an expression before compiling it.
+    compile_expression: Compiles a function string into a callable.
+    solve_vectorized_chunk: Solves a chunk of starting points in a worker process.
 """
 
 # Standard Library Imports
+import ast
+import cmath
+import functools
 import math
+import operator
 import time
-from tkinter import messagebox
+from concurrent.futures import ProcessPoolExecutor
+
+# Third-Party Library Imports
+import numpy as np
+
+# Local Imports
+from instrumentation import ExpressionProfiler, InstrumentedFunction, SolverMetrics
+
+# Acceleration modes accepted by RootFinderMethods.fixed_point
+FIXED_POINT_ACCELERATIONS = (None, "aitken", "steffensen", "anderson")
+
+# Names available to expressions, for scalar and vectorized evaluation
+MATH_NAMESPACE = {
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "exp": math.exp,
+    "log": math.log,
+    "sqrt": math.sqrt,
+    "pi": math.pi,
+}
+NUMPY_NAMESPACE = {
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "exp": np.exp,
+    "log": np.log,
+    "sqrt": np.sqrt,
+    "pi": np.pi,
+}
+CMATH_NAMESPACE = {
+    "sin": cmath.sin,
+    "cos": cmath.cos,
+    "tan": cmath.tan,
+    "exp": cmath.exp,
+    "log": cmath.log,
+    "sqrt": cmath.sqrt,
+    "pi": cmath.pi,
+    "I": 1j,
+}
+COMPLEX_NUMPY_NAMESPACE = {**NUMPY_NAMESPACE, "I": 1j}
+
+# Largest integer power of a name rewritten as products in vectorized code
+MAX_EXPANDED_POWER = 8
+
+# Syntax accepted in expressions, everything else is rejected when parsing
+ARITHMETIC_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+ALLOWED_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.BoolOp,
+    ast.Compare,
+    ast.IfExp,
+    ast.Call,
+    ast.Name,
+    ast.Constant,
+    ast.Load,
+    *ARITHMETIC_OPERATORS,
+    ast.UAdd,
+    ast.USub,
+    ast.Not,
+    ast.And,
+    ast.Or,
+    ast.Eq,
+    ast.NotEq,
+    ast.Lt,
+    ast.LtE,
+    ast.Gt,
+    ast.GtE,
+)
+
+# Constants accepted in expressions, and the largest constant exponent, so
+# integer powers cannot grow without bound
+CONSTANT_TYPES = (int, float, complex)
+MAX_CONSTANT_EXPONENT = 1024
+
+
+def fold_constant(node):
+    """
+    Evaluates a subexpression made only of numeric constants.
+
+    Integers are folded as floats, so folding cannot build huge integers
+    itself, and an overflow shows as an infinite value.
+
+    Args:
+        node (ast.expr): The subexpression.
+
+    Returns:
+        The value of the subexpression, or None if it is not constant.
+    """
+    if isinstance(node, ast.Constant):
+        if type(node.value) not in CONSTANT_TYPES:
+            return None
+        return node.value if isinstance(node.value, complex) else float(node.value)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        value = fold_constant(node.operand)
+        if value is None or isinstance(node.op, ast.UAdd):
+            return value
+        return -value
+    if isinstance(node, ast.BinOp) and type(node.op) in ARITHMETIC_OPERATORS:
+        left, right = fold_constant(node.left), fold_constant(node.right)
+        if left is None or right is None:
+            return None
+        try:
+            return ARITHMETIC_OPERATORS[type(node.op)](left, right)
+        except OverflowError:
+            return math.inf
+        except (ArithmeticError, TypeError, ValueError):
+            # Left for the evaluation to report
+            return math.nan
+    return None
+
+
+class _PowerExpander(ast.NodeTransformer):
+    """
+    Rewrites small integer powers of a name, such as x**3, as x*x*x.
+
+    NumPy evaluates these powers with the generic `pow` (about 40 times slower
+    than multiplying), except for the squares it already special-cases.
+    """
+
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        exponent = node.right
+        if (
+            isinstance(node.op, ast.Pow)
+            and isinstance(node.left, ast.Name)
+            and isinstance(exponent, ast.Constant)
+            and type(exponent.value) is int
+            and 2 < exponent.value <= MAX_EXPANDED_POWER
+        ):
+            product = node.left
+            for _ in range(exponent.value - 1):
+                product = ast.BinOp(left=product, op=ast.Mult(), right=node.left)
+            return ast.copy_location(product, node)
+        return node
+
+
+def parse_expression(expr, allowed, label="function", expand_powers=False):
+    """
+    Parses and validates an expression before compiling it.
+
+    Expressions may come from untrusted sources (the HTTP service), so only
+    arithmetic, comparisons, conditionals, calls and the names in `allowed`
+    may appear (a tuple is accepted as the whole expression, for systems).
+    Constants must be numbers, constant subexpressions must not overflow and
+    constant exponents are limited, so no expression can build huge integers
+    from its literals. The code must then be evaluated with
+    `"__builtins__": {}` in its globals.
+
+    Args:
+        expr (str): The expression, "^" is accepted for powers.
+        allowed (collections.abc.Container): The names the expression may use.
+        label (str): How the expression is named in error messages.
+        expand_powers (bool): Whether to rewrite small integer powers as
+            products, which is faster for NumPy arrays.
+
+    Returns:
+        code: The compiled expression.
+    """
+    try:
+        tree = ast.parse(expr.replace("^", "**"), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid {label}: {e}")
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Tuple) and node is tree.body:
+            continue
+        if not isinstance(node, ALLOWED_NODES):
+            if isinstance(node, ast.expr):
+                what = ast.unparse(node)
+            else:
+                what = type(node).__name__
+            raise ValueError(f"Invalid {label}: '{what}' is not allowed")
+        if isinstance(node, ast.Name) and node.id not in allowed:
+            raise ValueError(f"Invalid {label}: name '{node.id}' is not defined")
+        if isinstance(node, ast.Constant) and type(node.value) not in CONSTANT_TYPES:
+            raise ValueError(f"Invalid {label}: constant {node.value!r} is not allowed")
+        if isinstance(node, ast.BinOp):
+            value = fold_constant(node)
+            if value is not None and cmath.isinf(value):
+                raise ValueError(f"Invalid {label}: '{ast.unparse(node)}' is too large")
+            exponent = fold_constant(node.right)
+            if (
+                isinstance(node.op, ast.Pow)
+                and exponent is not None
+                and abs(exponent) > MAX_CONSTANT_EXPONENT
+            ):
+                raise ValueError(
+                    f"Invalid {label}: exponents are limited to "
+                    f"{MAX_CONSTANT_EXPONENT} in magnitude"
+                )
+    if expand_powers:
+        tree = ast.fix_missing_locations(_PowerExpander().visit(tree))
+    return compile(tree, "<expression>", "eval")
+
+
+@functools.lru_cache(maxsize=256)
+def compile_expression(expr, label="function", vectorized=False, complex_values=False):
+    """
+    Compiles a function string into a callable of x.
+
+    The string is compiled once, so repeated evaluations skip parsing, and the
+    compiled callables are cached per expression. With `vectorized` the
+    callable evaluates NumPy arrays element-wise and always returns an array
+    shaped like its input. With `complex_values` the functions come from
+    `cmath` (or complex NumPy ufuncs) and "I" names the imaginary unit.
+
+    Args:
+        expr (str): The function as a string, "^" is accepted for powers.
+        label (str): How the function is named in error messages.
+        vectorized (bool): Whether to evaluate with NumPy ufuncs.
+        complex_values (bool): Whether to evaluate in the complex plane.
+
+    Returns:
+        callable: The compiled function.
+    """
+    if vectorized:
+        namespace = COMPLEX_NUMPY_NAMESPACE if complex_values else NUMPY_NAMESPACE
+    else:
+        namespace = CMATH_NAMESPACE if complex_values else MATH_NAMESPACE
+    code = parse_expression(expr, {*namespace, "x"}, label, expand_powers=vectorized)
+    namespace = {"__builtins__": {}, **namespace}
+
+    def f(x):
+        try:
+            if not vectorized:
+                return eval(code, {**namespace, "x": x})
+            # Domain errors become NaN/inf lanes instead of warnings
+            with np.errstate(all="ignore"):
+                result = eval(code, {**namespace, "x": x})
+        except Exception as e:
+            raise ValueError(f"Invalid {label}: {e}")
+        return np.broadcast_to(result, np.shape(x))
+
+    return f
 
 
 class RootFinderMethods:
@@ -22,6 +276,7 @@ class RootFinderMethods:
         numerical_derivative: Computes the numerical derivative of a function.
         bisection: Finds a root using the bisection method.
         newton_raphson: Finds a root using the Newton-Raphson method.
+        safeguarded_newton: Finds a root using Newton-Raphson safeguarded by bisection.
         false_position: Finds a root using the false position method.
         fixed_point: Finds a root using the fixed-point iteration method.
         secant: Finds a root using the secant method.
@@ -40,6 +295,9 @@ class RootFinderMethods:
         Returns:
             float: The numerical derivative of the function at the given point.
         """
+        record = getattr(f, "record_derivative", None)
+        if record:
+            record()
         return (f(x + h) - f(x - h)) / (2 * h)
 
     @staticmethod
@@ -96,6 +354,90 @@ class RootFinderMethods:
             iterations += 1
         return x0, iterations
 
+    @staticmethod
+    def safeguarded_newton(
+        f, a, b, tol=1e-6, max_iter=100, damping=1.0, line_search=True
+    ):
+        """
+        Finds a root using Newton-Raphson safeguarded by bisection.
+
+        A bracket [a, b] with a sign change is kept at all times. A bisection
+        step is taken whenever the Newton step leaves the bracket, is not
+        shrinking faster than bisection would, or (with line search) fails to
+        reduce |f(x)|. Convergence is therefore guaranteed while keeping the
+        quadratic rate of Newton-Raphson close to the root.
+
+        Args:
+            f (callable): The function to find the root of.
+            a (float): The start of the interval.
+            b (float): The end of the interval.
+            tol (float): The tolerance for the root.
+            max_iter (int): The maximum number of iterations.
+            damping (float): Factor in (0, 1] applied to every Newton step.
+            line_search (bool): Whether to backtrack the Newton step until
+                |f(x)| decreases.
+
+        Returns:
+            tuple: The root, the number of iterations, and the list of step
+                types taken ("newton", "damped" or "bisection").
+        """
+        if not 0 < damping <= 1:
+            raise ValueError("Damping must be in the interval (0, 1].")
+        fa, fb = f(a), f(b)
+        if fa == 0:
+            return a, 0, []
+        if fb == 0:
+            return b, 0, []
+        if fa * fb > 0:
+            raise ValueError("The function must have opposite signs at the endpoints.")
+
+        # Orient the bracket so that f(lo) < 0 < f(hi)
+        lo, hi = (a, b) if fa < 0 else (b, a)
+        x = (a + b) / 2
+        fx = f(x)
+        # The midpoint already halves the bracket, like a first bisection step
+        if fx < 0:
+            lo = x
+        else:
+            hi = x
+        dx_old = dx = abs(b - a)
+        steps = []
+        iterations = 0
+        while abs(fx) > tol and abs(hi - lo) / 2 > tol and iterations < max_iter:
+            df = RootFinderMethods.numerical_derivative(f, x)
+            step = "bisection"
+            if df != 0 and math.isfinite(df):
+                newton_dx = damping * fx / df
+                x_new = x - newton_dx
+                inside = min(lo, hi) < x_new < max(lo, hi)
+                if inside and abs(2 * newton_dx) <= abs(dx_old):
+                    step = "newton" if damping == 1 else "damped"
+                    if line_search:
+                        f_new = f(x_new)
+                        lam = 1.0
+                        while abs(f_new) >= abs(fx) and lam > 1 / 16:
+                            lam /= 2
+                            x_new = x - lam * newton_dx
+                            f_new = f(x_new)
+                            step = "damped"
+                        if abs(f_new) >= abs(fx):
+                            step = "bisection"
+            dx_old = dx
+            if step == "bisection":
+                x_new = (lo + hi) / 2
+                f_new = f(x_new)
+            elif not line_search:
+                f_new = f(x_new)
+            dx = abs(x_new - x)
+            x, fx = x_new, f_new
+            if fx < 0:
+                lo = x
+            else:
+                hi = x
+            steps.append(step)
+            iterations += 1
+        return x, iterations, steps
+
     @staticmethod
     def false_position(f, a, b, tol=1e-6, max_iter=100):
         """
@@ -127,28 +469,113 @@ class RootFinderMethods:
         return c, iterations
 
     @staticmethod
-    def fixed_point(_, g, x0, tol=1e-6, max_iter=100):
+    def fixed_point(_, g, x0, tol=1e-6, max_iter=100, acceleration=None, depth=1):
         """
         Finds a root using the fixed-point iteration method.
 
+        The plain iteration x1 = g(x0) converges linearly with rate |g'(x*)|.
+        The optional acceleration modes are:
+            "aitken": Aitken's delta-squared extrapolation of the plain
+                sequence, converged on the extrapolated values.
+            "steffensen": Steffensen's method, restarting from the Aitken
+                extrapolate at every step (quadratic convergence).
+            "anderson": Anderson mixing over the last `depth` iterates
+                (superlinear convergence). A mixed step that increases
+                |g(x) - x| is replaced by the plain step. For a scalar g a
+                single difference already determines the fit, so deeper
+                histories only add round-off.
+
         Args:
             _: Placeholder for the function (not used).
             g (callable): The function for fixed-point iteration.
             x0 (float): The initial guess.
             tol (float): The tolerance for the root.
             max_iter (int): The maximum number of iterations.
+            acceleration (str): None, "aitken", "steffensen" or "anderson".
+            depth (int): The history depth used by Anderson mixing.
 
         Returns:
             tuple: The root and the number of iterations.
         """
+        if acceleration not in FIXED_POINT_ACCELERATIONS:
+            raise ValueError(f"Invalid acceleration: {acceleration}")
+        if acceleration == "anderson" and depth < 1:
+            raise ValueError("Anderson depth must be at least 1.")
+
+        def extrapolate(x0, x1, x2):
+            denominator = x2 - 2 * x1 + x0
+            if denominator == 0:
+                return x2
+            return x0 - (x1 - x0) ** 2 / denominator
+
         iterations = 0
-        x1 = x0
-        while iterations < max_iter:
+        if acceleration == "aitken":
             x1 = g(x0)
-            if abs(x1 - x0) < tol:
-                return x1, iterations
-            x0 = x1
-            iterations += 1
+            previous = x0
+            while iterations < max_iter:
+                x2 = g(x1)
+                x_acc = extrapolate(x0, x1, x2)
+                if abs(x_acc - previous) < tol or abs(x2 - x1) < tol:
+                    return x_acc, iterations
+                previous = x_acc
+                x0, x1 = x1, x2
+                iterations += 1
+        elif acceleration == "steffensen":
+            while iterations < max_iter:
+                x1 = g(x0)
+                if abs(x1 - x0) < tol:
+                    return x1, iterations
+                x_acc = extrapolate(x0, x1, g(x1))
+                if abs(x_acc - x0) < tol:
+                    return x_acc, iterations
+                x0 = x_acc
+                iterations += 1
+        elif acceleration == "anderson":
+            # Residual and iterate differences of the last `depth` steps
+            d_residuals, d_iterates = [], []
+            residual_old = None
+            mixed = False
+            while iterations < max_iter:
+                residual = g(x0) - x0
+                if abs(residual) < tol:
+                    return x0 + residual, iterations
+                if mixed and abs(residual) > abs(residual_old):
+                    # The mixed step increased the residual: take the plain
+                    # step from the previous iterate and restart the history
+                    record = getattr(g, "record_fallback", None)
+                    if record:
+                        record("plain fixed-point step")
+                    x0 = x_old + residual_old
+                    d_residuals, d_iterates = [], []
+                    residual_old = None
+                    mixed = False
+                    iterations += 1
+                    continue
+                if residual_old is not None:
+                    d_residuals.append(residual - residual_old)
+                    d_iterates.append(x0 - x_old)
+                    if len(d_residuals) > depth:
+                        d_residuals.pop(0)
+                        d_iterates.pop(0)
+                x_old, residual_old = x0, residual
+                # Minimal-norm least-squares coefficients of the residual
+                # in the span of the residual differences
+                norm = sum(dr * dr for dr in d_residuals)
+                x1 = x0 + residual
+                mixed = norm > 0
+                if mixed:
+                    for dr, dx in zip(d_residuals, d_iterates):
+                        x1 -= (dx + dr) * dr * residual / norm
+                x0 = x1
+                iterations += 1
+        else:
+            x1 = x0
+            while iterations < max_iter:
+                x1 = g(x0)
+                if abs(x1 - x0) < tol:
+                    return x1, iterations
+                x0 = x1
+                iterations += 1
         raise ValueError("Fixed-point iteration did not converge.")
 
     @staticmethod
@@ -178,21 +605,290 @@ class RootFinderMethods:
         return c, iterations
 
 
+class VectorizedRootFinderMethods:
+    """
+    Array versions of the open root-finding methods.
+
+    Every starting point is an independent lane. Lanes are iterated together
+    with NumPy and removed from the working set once they converge or fail,
+    so later iterations only evaluate the lanes still running.
+
+    Methods:
+        numerical_derivative: Computes the numerical derivative element-wise.
+        newton_raphson: Runs Newton-Raphson from an array of initial guesses.
+        secant: Runs the secant method from arrays of starting pairs.
+        unique_roots: Deduplicates the roots found by converged lanes.
+    """
+
+    @staticmethod
+    def numerical_derivative(f, x, h=1e-5):
+        """
+        Computes the numerical derivative of a vectorized function.
+
+        Args:
+            f (callable): The vectorized function to differentiate.
+            x (numpy.ndarray): The points at which to compute the derivative.
+            h (float): The step size for the numerical derivative.
+
+        Returns:
+            numpy.ndarray: The numerical derivative at each point.
+        """
+        record = getattr(f, "record_derivative", None)
+        if record:
+            record(np.size(x))
+        with np.errstate(all="ignore"):
+            return (f(x + h) - f(x - h)) / (2 * h)
+
+    @staticmethod
+    def newton_raphson(f, x0, tol=1e-6, max_iter=100, bound=1e12):
+        """
+        Runs the Newton-Raphson method from an array of initial guesses.
+
+        A lane fails when its derivative is too close to zero, or when f(x)
+        or the next iterate is NaN, infinite or beyond `bound`.
+
+        Args:
+            f (callable): The vectorized function to find the roots of.
+            x0 (array_like): The initial guesses.
+            tol (float): The tolerance for the roots.
+            max_iter (int): The maximum number of iterations per lane.
+            bound (float): Iterates larger than this in magnitude diverged.
+
+        Returns:
+            tuple: The final iterates, the iterations per lane, and the mask of
+                converged lanes, all shaped like `x0`.
+        """
+        x = np.array(x0, dtype=float)
+        shape = x.shape
+        x = x.ravel()
+        iterations = np.zeros(x.size, dtype=int)
+        converged = np.zeros(x.size, dtype=bool)
+        # The running lanes are iterated in compact arrays, and written back
+        # to x and iterations only when they leave the working set
+        lanes, xa = np.arange(x.size), x.copy()
+        for step in range(max_iter + 1):
+            if lanes.size == 0:
+                break
+            fx = f(xa)
+            done = np.abs(fx) <= tol
+            converged[lanes[done]] = True
+            running = ~done & np.isfinite(fx) & (step < max_iter)
+            if not running.all():
+                x[lanes[~running]] = xa[~running]
+                iterations[lanes[~running]] = step
+                lanes, xa, fx = lanes[running], xa[running], fx[running]
+                if lanes.size == 0:
+                    break
+            df = VectorizedRootFinderMethods.numerical_derivative(f, xa)
+            with np.errstate(all="ignore"):
+                x_new = xa - fx / df
+            ok = (np.abs(df) >= 1e-10) & np.isfinite(x_new) & (np.abs(x_new) <= bound)
+            if not ok.all():
+                x[lanes[~ok]] = xa[~ok]
+                iterations[lanes[~ok]] = step
+                lanes, x_new = lanes[ok], x_new[ok]
+            xa = x_new
+        return x.reshape(shape), iterations.reshape(shape), converged.reshape(shape)
+
+    @staticmethod
+    def secant(f, a, b, tol=1e-6, max_iter=100, bound=1e12):
+        """
+        Runs the secant method from arrays of starting pairs.
+
+        `a` and `b` are broadcast against each other. A lane fails when its
+        secant is flat, when the next iterate is NaN, infinite or beyond
+        `bound`, or when its steps stall while f(x) is still large.
+
+        Args:
+            f (callable): The vectorized function to find the roots of.
+            a (array_like): The first starting points.
+            b (array_like): The second starting points.
+            tol (float): The tolerance for the roots.
+            max_iter (int): The maximum number of iterations per lane.
+            bound (float): Iterates larger than this in magnitude diverged.
+
+        Returns:
+            tuple: The final iterates, the iterations per lane, and the mask of
+                converged lanes, all shaped like the broadcast starts.
+        """
+        a, b = np.broadcast_arrays(np.array(a, dtype=float), np.array(b, dtype=float))
+        shape = a.shape
+        a, b = a.ravel(), b.ravel()
+        x = b.copy()
+        iterations = np.zeros(x.size, dtype=int)
+        fa, fb = f(a), f(b)
+        # Only a small residual counts, close starting points are not a root
+        converged = np.abs(fb) < tol
+        running = ~converged & np.isfinite(fa) & np.isfinite(fb)
+        # The running lanes are iterated in compact arrays, and written back
+        # to x and iterations only when they leave the working set
+        lanes = np.flatnonzero(running)
+        aa, bb, fa, fb = a[running], b[running], fa[running], fb[running]
+        for step in range(max_iter):
+            if lanes.size == 0:
+                break
+            with np.errstate(all="ignore"):
+                c = bb - fb * (bb - aa) / (fb - fa)
+            ok = np.isfinite(c) & (np.abs(c) <= bound)
+            if not ok.all():
+                x[lanes[~ok]] = bb[~ok]
+                iterations[lanes[~ok]] = step
+                lanes, aa, bb, fa, fb, c = (
+                    lanes[ok],
+                    aa[ok],
+                    bb[ok],
+                    fa[ok],
+                    fb[ok],
+                    c[ok],
+                )
+            fc = f(c)
+            small = np.abs(fc) < tol
+            # A stalled step only counts as converged if the residual is
+            # consistent with a root within tol of c
+            stalled = ~small & (np.abs(c - bb) <= tol)
+            with np.errstate(all="ignore"):
+                slope = np.abs((fc - fb) / (c - bb))
+            converged[lanes[small | (stalled & (np.abs(fc) <= tol * slope))]] = True
+            running = ~(small | stalled) & np.isfinite(fc)
+            if not running.all():
+                x[lanes[~running]] = c[~running]
+                # The scalar method stops on a small residual before counting
+                # the step, so converged lanes do not count their last one
+                iterations[lanes[~running]] = step + 1 - small[~running]
+                lanes, bb, fb, c, fc = (
+                    lanes[running],
+                    bb[running],
+                    fb[running],
+                    c[running],
+                    fc[running],
+                )
+            aa, bb, fa, fb = bb, c, fb, fc
+        x[lanes] = bb
+        iterations[lanes] = max_iter
+        return x.reshape(shape), iterations.reshape(shape), converged.reshape(shape)
+
+    @staticmethod
+    def unique_roots(roots, converged=None, tol=1e-6):
+        """
+        Deduplicates the roots found by many lanes.
+
+        Roots closer than `tol` to their sorted neighbour are merged into one
+        cluster, represented by the cluster mean.
+
+        Args:
+            roots (array_like): The roots found by each lane.
+            converged (array_like): Mask of the lanes to consider.
+            tol (float): The distance under which two roots are the same.
+
+        Returns:
+            tuple: The sorted distinct roots and how many lanes found each.
+        """
+        roots = np.asarray(roots, dtype=float)
+        if converged is not None:
+            roots = roots[np.asarray(converged, dtype=bool)]
+        roots = np.sort(roots[np.isfinite(roots)])
+        if roots.size == 0:
+            return roots, np.zeros(0, dtype=int)
+        starts = np.flatnonzero(np.diff(roots, prepend=-np.inf) > tol)
+        counts = np.diff(np.append(starts, roots.size))
+        return np.add.reduceat(roots, starts) / counts, counts
+
+
 class FunctionSolver:
     """
     Handles the evaluation and solving of functions.
 
+    Every solve is instrumented: function and derivative evaluations,
+    iterations, fallbacks and compiled-expression cache hits are counted, and
+    times are measured with `time.perf_counter_ns`.
+
     Attributes:
         finder (RootFinderMethods): An instance of RootFinderMethods for root-finding.
+        vectorized_finder (VectorizedRootFinderMethods): Array root-finding methods.
+        last_steps (list): Step types taken by the last Newton-Raphson solve.
+        metrics (SolverMetrics): Metrics accumulated over every solve.
+        last_metrics (SolverMetrics): Metrics of the last solve, even if it raised.
+        profile_every (int): Profile one evaluation out of this many, 0 disables.
     """
 
-    def __init__(self):
+    def __init__(self, profile_every=0):
         """
         Initializes the FunctionSolver.
+
+        Args:
+            profile_every (int): Attribute the time of one evaluation out of
+                this many to the nodes of the expression, 0 disables.
         """
         self.finder = RootFinderMethods()
+        self.vectorized_finder = VectorizedRootFinderMethods()
+        self.last_steps = []
+        self.metrics = SolverMetrics()
+        self.last_metrics = SolverMetrics()
+        self.profile_every = profile_every
+
+    def _instrument(self, expr, label, metrics, vectorized=False):
+        """
+        Compiles an expression and wraps it to record its evaluations.
+
+        Args:
+            expr (str): The function as a string.
+            label (str): How the function is named in error messages.
+            metrics (SolverMetrics): Where the evaluations are recorded.
+            vectorized (bool): Whether to evaluate with NumPy ufuncs.
+
+        Returns:
+            InstrumentedFunction: The instrumented function.
+        """
+        hits = compile_expression.cache_info().hits
+        function = compile_expression(expr, label, vectorized)
+        if compile_expression.cache_info().hits > hits:
+            metrics.count("cache_hits")
+        else:
+            metrics.count("cache_misses")
+        profiler = None
+        if self.profile_every > 0 and not vectorized:
+            profiler = ExpressionProfiler(
+                expr.replace("^", "**"), MATH_NAMESPACE, label
+            )
+        return InstrumentedFunction(function, metrics, profiler, self.profile_every)
+
+    def _start_metrics(self):
+        """
+        Creates the metrics of a new solve, sharing the registered hooks.
+
+        Returns:
+            SolverMetrics: The metrics of the solve.
+        """
+        metrics = SolverMetrics()
+        metrics.hooks = self.metrics.hooks
+        # Set now, so a solve that raises does not leave the previous metrics
+        self.last_metrics = metrics
+        return metrics
+
+    def _finish_metrics(self, metrics, solve_time_ns):
+        """
+        Records the end of a solve and merges its metrics into the totals.
+
+        Args:
+            metrics (SolverMetrics): The metrics of the solve.
+            solve_time_ns (int): The time spent in the method itself.
+        """
+        metrics.count("solves")
+        metrics.add_time("solve_time_ns", solve_time_ns)
+        self.metrics.merge(metrics)
+        metrics.emit("solve", metrics.to_dict())
 
-    def solve(self, f_str, a, b, tol, method_name, g_str=None):
+    def solve(
+        self,
+        f_str,
+        a,
+        b,
+        tol,
+        method_name,
+        g_str=None,
+        acceleration=None,
+        depth=1,
+    ):
         """
         Solves the function using the selected method.
 
@@ -203,92 +899,179 @@ class FunctionSolver:
             tol (float): The tolerance for the root.
             method_name (str): The name of the method to use.
             g_str (str): The g(x) function as a string (for fixed-point iteration).
+            acceleration (str): The fixed-point acceleration mode, if any.
+            depth (int): The history depth for Anderson mixing.
 
         Returns:
             tuple: The root, the number of iterations, and the computation time.
         """
-        f_str = f_str.replace("^", "**")
-
-        def f(x):
-            try:
-                return eval(
-                    f_str,
-                    {
-                        "x": x,
-                        "sin": math.sin,
-                        "cos": math.cos,
-                        "tan": math.tan,
-                        "exp": math.exp,
-                        "log": math.log,
-                        "sqrt": math.sqrt,
-                        "pi": math.pi,
-                    },
-                )
-            except Exception as e:
-                raise ValueError(f"Invalid function: {e}")
+        metrics = self._start_metrics()
+        setup_start = time.perf_counter_ns()
+        f = self._instrument(f_str, "function", metrics)
 
         # Get the method from RootFinderMethods
         method = getattr(self.finder, method_name, None)
         if not method:
             raise ValueError(f"Invalid method selected: {method_name}")
 
+        if method_name == "fixed_point":
+            if not g_str:
+                raise ValueError("g(x) is required for Fixed-Point Iteration.")
+            g = self._instrument(g_str, "g(x)", metrics)
+        metrics.add_time("setup_time_ns", time.perf_counter_ns() - setup_start)
+
         # Solve using the selected method
-        start_time = time.time()
+        self.last_steps = []
+        start_time = time.perf_counter_ns()
         if method_name in ["bisection", "false_position", "secant"]:
             root, iterations = method(f, a, b, tol)
         elif method_name == "newton_raphson":
-            interval_adjusted = False
-            while a < b:
-                try:
-                    root, iterations = method(f, a, tol)
-                    if a <= root <= b:
-                        break
-                    else:
-                        a += 0.1
-                        b -= 0.1
-                        interval_adjusted = True
-                except ValueError as e:
-                    messagebox.showwarning(
-                        "Warning",
-                        f"Newton-Raphson failed: {e}\nFalling back to Bisection.",
-                    )
-                    root, iterations = self.finder.bisection(f, a, b, tol)
-                    break
-            else:
-                raise ValueError(
-                    "Newton-Raphson could not find a root within the interval. Try another method or adjust the interval."
-                )
-            if interval_adjusted:
-                messagebox.showinfo(
-                    "Interval Adjusted",
-                    f"Root was outside the interval. Final interval used: [{a:.2f}, {b:.2f}]",
+            try:
+                root, iterations, self.last_steps = self.finder.safeguarded_newton(
+                    f, a, b, tol
                 )
-        elif method_name == "fixed_point":
-            if not g_str:
-                raise ValueError("g(x) is required for Fixed-Point Iteration.")
-            g_str = g_str.replace("^", "**")
-
-            def g(x):
-                try:
-                    return eval(
-                        g_str,
-                        {
-                            "x": x,
-                            "sin": math.sin,
-                            "cos": math.cos,
-                            "tan": math.tan,
-                            "exp": math.exp,
-                            "log": math.log,
-                            "sqrt": math.sqrt,
-                            "pi": math.pi,
-                        },
+            except ValueError:
+                # No sign change on [a, b]: plain Newton from a, kept only if
+                # the root lands inside the interval
+                metrics.record_fallback("newton_raphson without bracket")
+                root, iterations = method(f, a, tol)
+                if not a <= root <= b:
+                    raise ValueError(
+                        "Newton-Raphson could not find a root within the interval. Try another method or adjust the interval."
                     )
-                except Exception as e:
-                    raise ValueError(f"Invalid g(x): {e}")
-
-            root, iterations = method(f, g, a, tol)
+                self.last_steps = ["newton"] * iterations
+            bisections = self.last_steps.count("bisection")
+            if bisections:
+                metrics.record_fallback("bisection step", bisections)
+        elif method_name == "fixed_point":
+            root, iterations = method(
+                f, g, a, tol, acceleration=acceleration, depth=depth
+            )
         else:
             raise ValueError(f"Invalid method selected: {method_name}")
 
-        computation_time = time.time() - start_time
-        return root, iterations, computation_time
+        solve_time_ns = time.perf_counter_ns() - start_time
+        metrics.record_iterations(iterations)
+        self._finish_metrics(metrics, solve_time_ns)
+        return root, iterations, solve_time_ns / 1e9
+
+    def convergence_map(
+        self, f_str, a, b, method_name, n=100_000, tol=1e-6, max_iter=50, processes=None
+    ):
+        """
+        Computes which root each starting point on [a, b] converges to.
+
+        The open method is run from `n` evenly spaced starts at once. With
+        `processes` the starts are split into chunks solved by a process pool,
+        and the metrics of the workers are recorded as a single solve.
+
+        Args:
+            f_str (str): The function as a string.
+            a (float): The start of the range of starting points.
+            b (float): The end of the range of starting points.
+            method_name (str): "newton_raphson" or "secant".
+            n (int): The number of starting points.
+            tol (float): The tolerance for the roots.
+            max_iter (int): The maximum number of iterations per start.
+            processes (int): The number of worker processes, None for none.
+
+        Returns:
+            tuple: The starting points, the index of the root each start
+                converged to (-1 if it did not), the iterations per start,
+                and the sorted distinct roots.
+        """
+        starts = np.linspace(a, b, n)
+        if processes and processes > 1:
+            metrics = self._start_metrics()
+            start_time = time.perf_counter_ns()
+            chunks = [
+                (f_str, chunk, tol, method_name, max_iter)
+                for chunk in np.array_split(starts, processes)
+            ]
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                results = list(pool.map(solve_vectorized_chunk, chunks))
+            finals = np.concatenate([result[0] for result in results])
+            iterations = np.concatenate([result[1] for result in results])
+            converged = np.concatenate([result[2] for result in results])
+            for result in results:
+                metrics.merge(result[3])
+            # Every chunk counted itself as a solve, the map is one solve
+            # timed by the wall clock
+            metrics.counters["solves"] = metrics.counters["iterations"] = 0
+            metrics.timings["solve_time_ns"] = 0
+            metrics.record_iterations(iterations.sum())
+            self._finish_metrics(metrics, time.perf_counter_ns() - start_time)
+        else:
+            finals, iterations, converged, _ = self.solve_vectorized(
+                f_str, starts, tol, method_name, max_iter=max_iter
+            )
+
+        roots, _ = self.vectorized_finder.unique_roots(
+            finals, converged, max(100 * tol, 1e-8)
+        )
+        labels = np.full(n, -1)
+        if roots.size:
+            midpoints = (roots[1:] + roots[:-1]) / 2
+            labels[converged] = np.searchsorted(midpoints, finals[converged])
+        return starts, labels, iterations, roots
+
+    def solve_vectorized(self, f_str, x0, tol, method_name, x1=None, max_iter=100):
+        """
+        Solves the function from many starting points at once.
+
+        Args:
+            f_str (str): The function as a string.
+            x0 (array_like): The initial guesses (first points for the secant).
+            tol (float): The tolerance for the roots.
+            method_name (str): "newton_raphson" or "secant".
+            x1 (array_like): The second points for the secant method. Defaults
+                to `x0 + max(10 * tol, 1e-6)`, so the first step exceeds tol.
+            max_iter (int): The maximum number of iterations per lane.
+
+        Returns:
+            tuple: The final iterates, the iterations per lane, the mask of
+                converged lanes, and the computation time.
+        """
+        metrics = self._start_metrics()
+        setup_start = time.perf_counter_ns()
+        f = self._instrument(f_str, "function", metrics, vectorized=True)
+        metrics.add_time("setup_time_ns", time.perf_counter_ns() - setup_start)
+
+        start_time = time.perf_counter_ns()
+        if method_name == "newton_raphson":
+            roots, iterations, converged = self.vectorized_finder.newton_raphson(
+                f, x0, tol, max_iter
+            )
+        elif method_name == "secant":
+            if x1 is None:
+                x1 = np.asarray(x0, dtype=float) + max(10 * tol, 1e-6)
+            roots, iterations, converged = self.vectorized_finder.secant(
+                f, x0, x1, tol, max_iter
+            )
+        else:
+            raise ValueError(f"Invalid vectorized method: {method_name}")
+
+        solve_time_ns = time.perf_counter_ns() - start_time
+        metrics.record_iterations(iterations.sum())
+        self._finish_metrics(metrics, solve_time_ns)
+        return roots, iterations, converged, solve_time_ns / 1e9
+
+
+def solve_vectorized_chunk(args):
+    """
+    Solves a chunk of starting points in a worker process.
+
+    Args:
+        args (tuple): The function string, the starting points, the
+            tolerance, the method name and the maximum number of iterations.
+
+    Returns:
+        tuple: The final iterates, the iterations per lane, the mask of
+            converged lanes, and the metrics of the worker.
+    """
+    f_str, x0, tol, method_name, max_iter = args
+    solver = FunctionSolver()
+    roots, iterations, converged, _ = solver.solve_vectorized(
+        f_str, x0, tol, method_name, max_iter=max_iter
+    )
+    return roots, iterations, converged, solver.last_metrics
@@ -0,0 +1,346 @@
+"""
+Solver Instrumentation.
+
+This module provides counters, timing hooks and an expression profiler used to
+measure where solve time goes.
+
+Classes:
+    SolverMetrics: Collects counters and timings for one or many solves.
+    InstrumentedFunction: Wraps a function to count and time its evaluations.
+    ExpressionProfiler: Attributes evaluation time to expression nodes.
+"""
+
+# Standard Library Imports
+import ast
+import json
+import time
+
+# Nodes whose operands are evaluated lazily, profiled as a whole
+LAZY_NODES = (ast.IfExp, ast.BoolOp, ast.Compare)
+
+
+class SolverMetrics:
+    """
+    Collects counters and timings for one or many solves.
+
+    All times are integer nanoseconds measured with `time.perf_counter_ns`.
+    "function_evaluations" counts calls of the function, while
+    "point_evaluations" and "derivative_evaluations" count points: a
+    vectorized call over m lanes (or m systems) adds m, a scalar call adds 1.
+
+    Attributes:
+        counters (dict): Event counters (evaluations, iterations, fallbacks...).
+        timings (dict): Accumulated times in nanoseconds.
+        node_times (dict): Self time in nanoseconds per expression node.
+        hooks (list): Callbacks invoked as `hook(event, payload)`.
+    """
+
+    COUNTERS = (
+        "solves",
+        "function_evaluations",
+        "point_evaluations",
+        "derivative_evaluations",
+        "iterations",
+        "fallbacks",
+        "cache_hits",
+        "cache_misses",
+        "profiled_evaluations",
+    )
+    TIMINGS = ("function_time_ns", "solve_time_ns", "setup_time_ns")
+
+    def __init__(self):
+        """
+        Initializes the SolverMetrics with every counter at zero.
+        """
+        self.counters = dict.fromkeys(self.COUNTERS, 0)
+        self.timings = dict.fromkeys(self.TIMINGS, 0)
+        self.node_times = {}
+        self.hooks = []
+
+    def add_hook(self, hook):
+        """
+        Registers a callback for solver events.
+
+        Events are "solve" (payload: the metrics dictionary of the solve),
+        "fallback" (payload: a description of the fallback) and "iterations"
+        (payload: the total number of iterations of the solve, emitted once
+        per solve).
+
+        Args:
+            hook (callable): Called as `hook(event, payload)`.
+        """
+        self.hooks.append(hook)
+
+    def emit(self, event, payload=None):
+        """
+        Invokes every registered hook with an event.
+
+        Args:
+            event (str): The event name.
+            payload: Data describing the event.
+        """
+        for hook in self.hooks:
+            hook(event, payload)
+
+    def count(self, name, amount=1):
+        """
+        Increments a counter.
+
+        Args:
+            name (str): The counter name.
+            amount (int): The increment.
+        """
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def add_time(self, name, nanoseconds):
+        """
+        Accumulates a timing.
+
+        Args:
+            name (str): The timing name.
+            nanoseconds (int): The time to add.
+        """
+        self.timings[name] = self.timings.get(name, 0) + nanoseconds
+
+    def record_iterations(self, iterations):
+        """
+        Records the iterations of a solve.
+
+        Args:
+            iterations (int): The number of iterations taken.
+        """
+        self.count("iterations", int(iterations))
+        self.emit("iterations", int(iterations))
+
+    def record_fallback(self, description, amount=1):
+        """
+        Records fallbacks taken by a solver.
+
+        Args:
+            description (str): What the solver fell back to.
+            amount (int): How many times it fell back.
+        """
+        self.count("fallbacks", amount)
+        self.emit("fallback", description)
+
+    def merge(self, other):
+        """
+        Adds the counters and timings of another SolverMetrics to this one.
+
+        Args:
+            other (SolverMetrics): The metrics to merge in.
+        """
+        for name, value in other.counters.items():
+            self.count(name, value)
+        for name, value in other.timings.items():
+            self.add_time(name, value)
+        for label, value in other.node_times.items():
+            self.node_times[label] = self.node_times.get(label, 0) + value
+
+    def to_dict(self):
+        """
+        Exports the metrics as a structured dictionary.
+
+        Returns:
+            dict: The counters, timings and per-node profile.
+        """
+        return {
+            "counters": dict(self.counters),
+            "timings_ns": dict(self.timings),
+            "node_self_time_ns": dict(
+                sorted(self.node_times.items(), key=lambda item: -item[1])
+            ),
+        }
+
+    def to_json(self, **kwargs):
+        """
+        Exports the metrics as a JSON string.
+
+        Args:
+            **kwargs: Forwarded to `json.dumps`.
+
+        Returns:
+            str: The metrics as JSON.
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+class InstrumentedFunction:
+    """
+    Wraps a function to count and time its evaluations.
+
+    Every `profile_every`-th call is evaluated by an ExpressionProfiler instead,
+    which attributes its time to the nodes of the expression.
+
+    Attributes:
+        function (callable): The wrapped function.
+        metrics (SolverMetrics): Where the counters and timings are recorded.
+        profiler (ExpressionProfiler): The node profiler, if sampling is on.
+        profile_every (int): The sampling period of the profiler.
+    """
+
+    def __init__(
+        self, function, metrics, profiler=None, profile_every=0, point_size=1
+    ):
+        """
+        Initializes the InstrumentedFunction.
+
+        Args:
+            function (callable): The function to wrap.
+            metrics (SolverMetrics): Where the counters and timings are recorded.
+            profiler (ExpressionProfiler): The node profiler, if any.
+            profile_every (int): Profile one call out of this many, 0 disables.
+            point_size (int): How many values make one point, the number of
+                variables for systems.
+        """
+        self.function = function
+        self.metrics = metrics
+        self.profiler = profiler if profile_every > 0 else None
+        self.profile_every = profile_every
+        self.point_size = point_size
+        self._calls = 0
+
+    def __call__(self, x):
+        """
+        Evaluates the wrapped function, recording its count and time.
+
+        Args:
+            x: The point at which to evaluate the function.
+
+        Returns:
+            The value of the function.
+        """
+        self._calls += 1
+        self.metrics.counters["function_evaluations"] += 1
+        self.metrics.counters["point_evaluations"] += (
+            getattr(x, "size", 1) // self.point_size
+        )
+        start = time.perf_counter_ns()
+        if self.profiler and self._calls % self.profile_every == 0:
+            result = self.profiler.evaluate(x, self.metrics.node_times)
+            self.metrics.counters["profiled_evaluations"] += 1
+        else:
+            result = self.function(x)
+        self.metrics.timings["function_time_ns"] += time.perf_counter_ns() - start
+        return result
+
+    def record_derivative(self, points=1):
+        """
+        Records derivative evaluations, called by the numerical derivatives.
+
+        Args:
+            points (int): The number of points the derivative was taken at.
+        """
+        self.metrics.counters["derivative_evaluations"] += points
+
+    def record_fallback(self, description, amount=1):
+        """
+        Records fallbacks taken by a method using this function.
+
+        Args:
+            description (str): What the method fell back to.
+            amount (int): How many times it fell back.
+        """
+        self.metrics.record_fallback(description, amount)
+
+
+class ExpressionProfiler:
+    """
+    Attributes evaluation time to the nodes of an expression.
+
+    Every operation and call in the expression is compiled separately, with
+    its operands replaced by placeholders. Evaluating the tree bottom-up then
+    gives the self time of each node, keyed by its source text. Conditional
+    expressions, boolean operators and comparisons evaluate their operands
+    lazily, so they are kept whole as leaves to preserve their meaning.
+
+    Attributes:
+        namespace (dict): Names available to the expression.
+        label (str): How the expression is named in error messages.
+        root (tuple): The compiled node tree as (label, code, children).
+    """
+
+    def __init__(self, expr, namespace, label="function"):
+        """
+        Initializes the ExpressionProfiler.
+
+        Args:
+            expr (str): The expression, already using "**" for powers.
+            namespace (dict): Names available to the expression.
+            label (str): How the expression is named in error messages.
+        """
+        self.namespace = namespace
+        self.label = label
+        self.root = self._build(ast.parse(expr, mode="eval").body)
+
+    def _build(self, node):
+        """
+        Compiles a node and its operand subtrees.
+
+        Args:
+            node (ast.expr): The node to compile.
+
+        Returns:
+            tuple: The node label, its code object and its children.
+        """
+        label = ast.unparse(node)
+        body = ast.parse(label, mode="eval").body
+        children = []
+        if isinstance(body, LAZY_NODES):
+            expression = ast.Expression(body=body)
+            return label, compile(expression, "<profiled>", "eval"), children
+
+        def placeholder(child):
+            if isinstance(child, ast.expr) and not isinstance(
+                child, (ast.Name, ast.Constant)
+            ):
+                children.append(self._build(child))
+                return ast.Name(id=f"_node{len(children) - 1}", ctx=ast.Load())
+            return child
+
+        for field, value in ast.iter_fields(body):
+            if isinstance(value, list):
+                setattr(body, field, [placeholder(child) for child in value])
+            else:
+                setattr(body, field, placeholder(value))
+        expression = ast.fix_missing_locations(ast.Expression(body=body))
+        return label, compile(expression, "<profiled>", "eval"), children
+
+    def evaluate(self, x, node_times):
+        """
+        Evaluates the expression, accumulating the self time of every node.
+
+        Args:
+            x: The point at which to evaluate the expression.
+            node_times (dict): Accumulates nanoseconds per node label.
+
+        Returns:
+            The value of the expression.
+        """
+        try:
+            scope = {"__builtins__": {}, **self.namespace, "x": x}
+            return self._evaluate(self.root, scope, node_times)
+        except Exception as e:
+            raise ValueError(f"Invalid {self.label}: {e}")
+
+    def _evaluate(self, tree, scope, node_times):
+        """
+        Evaluates one node after its children.
+
+        Args:
+            tree (tuple): The node as built by `_build`.
+            scope (dict): The evaluation namespace.
+            node_times (dict): Accumulates nanoseconds per node label.
+
+        Returns:
+            The value of the node.
+        """
+        label, code, children = tree
+        local = {
+            f"_node{i}": self._evaluate(child, scope, node_times)
+            for i, child in enumerate(children)
+        }
+        start = time.perf_counter_ns()
+        value = eval(code, scope, local)
+        node_times[label] = node_times.get(label, 0) + time.perf_counter_ns() - start
+        return value
@@ -0,0 +1,155 @@
+"""
+Load Test Client for the Root-Finding Service.
+
+This module sends concurrent solve requests to `server.py` over keep-alive
+connections and reports throughput and latency percentiles.
+
+Usage:
+    python loadtest.py --requests 20000 --concurrency 64
+    python loadtest.py --unix /tmp/root-finder.sock
+"""
+
+# Standard Library Imports
+import argparse
+import asyncio
+import json
+import random
+import time
+
+# Requests sent by the load test, chosen at random
+REQUESTS = [
+    {"f": "sin(x) + cos(x) + 1", "a": 1, "b": 4, "method": "bisection"},
+    {"f": "sin(x) + cos(x) + 1", "a": 1, "b": 4, "method": "newton_raphson"},
+    {"f": "sin(x) + cos(x) + 1", "a": 1, "b": 4, "method": "secant"},
+    {"f": "x^3 - 2*x - 5", "a": 2, "b": 3, "method": "false_position"},
+    {
+        "f": "sin(x) + cos(x) + 1",
+        "g": "x - (sin(x) + cos(x) + 1) / 2",
+        "a": 1,
+        "method": "fixed_point",
+        "acceleration": "steffensen",
+    },
+]
+
+
+async def request(reader, writer, method, path, payload=None):
+    """
+    Sends one HTTP request over an open connection and reads the response.
+
+    Args:
+        reader (asyncio.StreamReader): The connection reader.
+        writer (asyncio.StreamWriter): The connection writer.
+        method (str): The HTTP method.
+        path (str): The request path.
+        payload (dict): The JSON body, if any.
+
+    Returns:
+        tuple: The HTTP status code and the decoded JSON response.
+    """
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\n"
+        "Host: localhost\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode()
+        + body
+    )
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    data = await reader.readexactly(int(headers.get("content-length", 0)))
+    return status, json.loads(data)
+
+
+async def connect(args):
+    """
+    Opens a connection to the service.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+
+    Returns:
+        tuple: The connection reader and writer.
+    """
+    if args.unix:
+        return await asyncio.open_unix_connection(args.unix)
+    return await asyncio.open_connection(args.host, args.port)
+
+
+async def client(args, count, latencies, failures):
+    """
+    Sends `count` solve requests one after another on a single connection.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+        count (int): The number of requests to send.
+        latencies (list): Receives the latency of every request in seconds.
+        failures (list): Receives the responses that were not 200 OK.
+    """
+    reader, writer = await connect(args)
+    try:
+        for _ in range(count):
+            payload = dict(random.choice(REQUESTS), tol=args.tol)
+            start = time.perf_counter()
+            status, result = await request(reader, writer, "POST", "/solve", payload)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                failures.append(result)
+    finally:
+        writer.close()
+
+
+async def main(args):
+    """
+    Runs the load test and prints its report.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+    """
+    latencies, failures = [], []
+    per_client = [
+        args.requests // args.concurrency + (i < args.requests % args.concurrency)
+        for i in range(args.concurrency)
+    ]
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(client(args, count, latencies, failures) for count in per_client)
+    )
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+
+    def percentile(q):
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000
+
+    print(f"Requests:    {len(latencies)} ({len(failures)} failed)")
+    print(f"Elapsed:     {elapsed:.3f} s")
+    print(f"Throughput:  {len(latencies) / elapsed:.0f} requests/s")
+    print(
+        f"Latency:     p50 {percentile(0.50):.2f} ms, p90 {percentile(0.90):.2f} ms, "
+        f"p99 {percentile(0.99):.2f} ms, max {latencies[-1] * 1000:.2f} ms"
+    )
+    if failures:
+        print(f"First failure: {failures[0]}")
+
+    reader, writer = await connect(args)
+    _, metrics = await request(reader, writer, "GET", "/metrics")
+    writer.close()
+    print(f"Server mean batch size: {metrics['mean_batch_size']:.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the root-finding service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="Connect to this Unix socket path instead")
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--tol", type=float, default=1e-6)
+    asyncio.run(main(parser.parse_args()))
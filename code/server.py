@@ -0,0 +1,480 @@
+"""
+Root-Finding HTTP/JSON Service.
+
+This module exposes FunctionSolver over a small asyncio HTTP/JSON server, so
+other services can find roots without the graphical interface.
+
+Concurrent requests sharing the same expression and settings are grouped into
+micro-batches and dispatched to a warm process pool. Each worker keeps its own
+FunctionSolver, whose compiled-expression cache is reused across batches. A
+batch running past the timeout is answered with an error and the pool is
+replaced, since a busy worker process cannot be interrupted otherwise.
+
+Endpoints:
+    POST /solve: Solves {"f", "a", "b", "tol", "method", "g", "acceleration",
+        "depth"} and returns {"root", "iterations", "computation_time"}.
+    GET /metrics: Returns latency, throughput, batching and solver metrics.
+    GET /health: Returns {"status": "ok"}.
+
+Classes:
+    ServiceMetrics: Tracks latency, throughput and batching of the service.
+    SolveServer: The asyncio server with request batching and worker pooling.
+
+Usage:
+    python server.py --port 8765 --workers 4 --timeout 10
+    python server.py --unix /tmp/root-finder.sock
+"""
+
+# Standard Library Imports
+import argparse
+import asyncio
+import bisect
+import json
+import math
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Local Imports
+from functions import FunctionSolver
+from instrumentation import SolverMetrics
+
+# FunctionSolver of the current worker process
+_worker_solver = None
+
+
+def _init_worker():
+    """
+    Creates the FunctionSolver of a worker process.
+    """
+    global _worker_solver
+    _worker_solver = FunctionSolver()
+
+
+def _warm_worker(_):
+    """
+    Forces a worker process to start and import the solver.
+
+    Returns:
+        int: The worker process id.
+    """
+    return os.getpid()
+
+
+def solve_batch(key, items):
+    """
+    Solves a batch of requests sharing the same expression and settings.
+
+    Args:
+        key (tuple): The function, method, tolerance, g(x), acceleration and
+            depth shared by the batch.
+        items (list): The (a, b) interval of every request.
+
+    Returns:
+        tuple: One result dictionary per request, and the solver metrics of
+            the batch.
+    """
+    f_str, method_name, tol, g_str, acceleration, depth = key
+    metrics = SolverMetrics()
+    results = []
+    for a, b in items:
+        try:
+            root, iterations, computation_time = _worker_solver.solve(
+                f_str, a, b, tol, method_name, g_str, acceleration, depth
+            )
+        except Exception as e:
+            results.append({"error": str(e)})
+            continue
+        if not math.isfinite(root):
+            results.append({"error": "The method did not produce a finite root."})
+            continue
+        results.append(
+            {
+                "root": root,
+                "iterations": iterations,
+                "computation_time": computation_time,
+            }
+        )
+        metrics.merge(_worker_solver.last_metrics)
+    return results, metrics
+
+
+class ServiceMetrics:
+    """
+    Tracks latency, throughput and batching of the service.
+
+    Attributes:
+        started (float): When the service started, from `time.perf_counter`.
+        requests (int): The number of solve requests answered.
+        errors (int): The number of requests answered with an error.
+        batches (int): The number of batches dispatched to the workers.
+        timeouts (int): The number of batches that ran past the timeout.
+        latencies (collections.deque): The most recent latencies in seconds.
+        completions (collections.deque): Completion times of recent requests.
+        solver (SolverMetrics): Solver metrics merged from every worker.
+    """
+
+    def __init__(self, window=10_000):
+        """
+        Initializes the ServiceMetrics.
+
+        Args:
+            window (int): How many recent requests the latency statistics use.
+        """
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.timeouts = 0
+        self.latencies = deque(maxlen=window)
+        self.completions = deque(maxlen=window)
+        self.solver = SolverMetrics()
+
+    def record(self, latency, error=False):
+        """
+        Records an answered request.
+
+        Args:
+            latency (float): The request latency in seconds.
+            error (bool): Whether the request failed.
+        """
+        self.requests += 1
+        self.errors += error
+        self.latencies.append(latency)
+        self.completions.append(time.perf_counter())
+
+    def to_dict(self):
+        """
+        Exports the metrics as a structured dictionary.
+
+        Returns:
+            dict: Request counts, latency percentiles, throughput and the
+                merged solver metrics.
+        """
+        latencies = sorted(self.latencies)
+
+        def percentile(q):
+            if not latencies:
+                return None
+            return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+        now = time.perf_counter()
+        recent = len(self.completions) - bisect.bisect_left(
+            self.completions, now - 1.0
+        )
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "batches": self.batches,
+            "timeouts": self.timeouts,
+            "mean_batch_size": self.requests / self.batches if self.batches else 0,
+            "uptime_s": now - self.started,
+            "throughput_rps": self.requests / (now - self.started),
+            "recent_throughput_rps": recent,
+            "latency_s": {
+                "p50": percentile(0.50),
+                "p90": percentile(0.90),
+                "p99": percentile(0.99),
+                "max": latencies[-1] if latencies else None,
+            },
+            "solver": self.solver.to_dict(),
+        }
+
+
+class SolveServer:
+    """
+    The asyncio HTTP/JSON server with request batching and worker pooling.
+
+    Attributes:
+        workers (int): The number of worker processes.
+        batch_window (float): How long the first request of a batch waits for
+            others, in seconds.
+        max_batch (int): The batch size that triggers an immediate dispatch.
+        timeout (float): How long a batch may run, in seconds.
+        metrics (ServiceMetrics): The service metrics.
+        pool (ProcessPoolExecutor): The warm worker pool.
+    """
+
+    def __init__(self, workers=None, batch_window=0.002, max_batch=64, timeout=10.0):
+        """
+        Initializes the SolveServer.
+
+        Args:
+            workers (int): The number of worker processes, defaults to the CPU count.
+            batch_window (float): The batching window in seconds.
+            max_batch (int): The maximum number of requests per batch.
+            timeout (float): How long a batch may run before the pool is replaced.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.timeout = timeout
+        self.metrics = ServiceMetrics()
+        self.pool = None
+        self._pending = {}
+
+    async def start(self, host="127.0.0.1", port=8765, unix_path=None):
+        """
+        Warms up the worker pool and starts listening.
+
+        Args:
+            host (str): The host to bind.
+            port (int): The TCP port to bind.
+            unix_path (str): A Unix socket path, used instead of host and port.
+
+        Returns:
+            asyncio.Server: The listening server.
+        """
+        await asyncio.gather(*self._start_pool())
+        if unix_path:
+            return await asyncio.start_unix_server(self._handle, path=unix_path)
+        return await asyncio.start_server(self._handle, host, port)
+
+    def close(self):
+        """
+        Shuts down the worker pool.
+        """
+        if self.pool:
+            self.pool.shutdown(cancel_futures=True)
+
+    def _start_pool(self):
+        """
+        Starts a new worker pool and warms up its workers.
+
+        Returns:
+            list: The futures of the warm-up tasks.
+        """
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_worker
+        )
+        loop = asyncio.get_running_loop()
+        return [
+            loop.run_in_executor(self.pool, _warm_worker, i)
+            for i in range(self.workers)
+        ]
+
+    def _recycle_pool(self):
+        """
+        Replaces the worker pool, terminating the workers of the old one.
+
+        Batches still running on the old pool are answered with an error.
+        """
+        pool = self.pool
+        self._start_pool()
+        # ProcessPoolExecutor only gained terminate_workers in Python 3.14
+        terminate = getattr(pool, "terminate_workers", None)
+        if terminate:
+            terminate()
+        else:
+            for process in list((pool._processes or {}).values()):
+                process.terminate()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def solve(self, request):
+        """
+        Queues a solve request into the batch of its expression and settings.
+
+        Args:
+            request (dict): The decoded JSON request.
+
+        Returns:
+            dict: The result, or {"error": message}.
+        """
+        try:
+            for name in ("g", "acceleration"):
+                if not isinstance(request.get(name), (str, type(None))):
+                    raise TypeError(f"'{name}' must be a string or null")
+            key = (
+                str(request["f"]),
+                str(request.get("method", "bisection")),
+                float(request.get("tol", 1e-6)),
+                request.get("g"),
+                request.get("acceleration"),
+                int(request.get("depth", 1)),
+            )
+            item = (float(request["a"]), float(request.get("b", request["a"])))
+            if not all(map(math.isfinite, (key[2], *item))):
+                raise ValueError("'a', 'b' and 'tol' must be finite numbers")
+        except (KeyError, TypeError, ValueError) as e:
+            return {"error": f"Invalid request: {e}"}
+
+        future = asyncio.get_running_loop().create_future()
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = []
+            asyncio.get_running_loop().call_later(
+                self.batch_window, self._dispatch, key
+            )
+        batch.append((item, future))
+        if len(batch) >= self.max_batch:
+            self._dispatch(key)
+        return await future
+
+    def _dispatch(self, key):
+        """
+        Sends the pending batch of a key to the worker pool.
+
+        Args:
+            key (tuple): The batch key.
+        """
+        batch = self._pending.pop(key, None)
+        if not batch:
+            return
+        self.metrics.batches += 1
+        items = [item for item, _ in batch]
+        futures = [future for _, future in batch]
+        loop = asyncio.get_running_loop()
+        task = loop.run_in_executor(self.pool, solve_batch, key, items)
+        timer = loop.call_later(self.timeout, self._expire, task, futures)
+        task.add_done_callback(lambda done: self._resolve(done, futures, timer))
+
+    def _expire(self, task, futures):
+        """
+        Answers a batch running past the timeout and replaces the pool.
+
+        Args:
+            task (asyncio.Future): The running batch.
+            futures (list): The futures of the requests in the batch.
+        """
+        if task.done():
+            return
+        self.metrics.timeouts += 1
+        error = {"error": f"The solve timed out after {self.timeout:g} s."}
+        for future in futures:
+            if not future.done():
+                future.set_result(error)
+        self._recycle_pool()
+
+    def _resolve(self, done, futures, timer=None):
+        """
+        Hands the results of a finished batch to the waiting requests.
+
+        Args:
+            done (asyncio.Future): The finished batch.
+            futures (list): The futures of the requests in the batch.
+            timer (asyncio.TimerHandle): The timeout of the batch, cancelled.
+        """
+        if timer:
+            timer.cancel()
+        if done.cancelled():
+            results = [{"error": "The worker pool was restarted."}] * len(futures)
+        elif done.exception():
+            results = [{"error": str(done.exception())}] * len(futures)
+        else:
+            results, metrics = done.result()
+            self.metrics.solver.merge(metrics)
+        for future, result in zip(futures, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _handle(self, reader, writer):
+        """
+        Serves the HTTP requests of one keep-alive connection.
+
+        Args:
+            reader (asyncio.StreamReader): The connection reader.
+            writer (asyncio.StreamWriter): The connection writer.
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                status, payload = await self._route(method, path, body)
+                data = json.dumps(payload, allow_nan=False).encode()
+                writer.write(
+                    f"HTTP/1.1 {status}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n\r\n".encode()
+                    + data
+                )
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method, path, body):
+        """
+        Answers one HTTP request.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The request path.
+            body (bytes): The request body.
+
+        Returns:
+            tuple: The HTTP status line and the JSON payload.
+        """
+        if method == "GET" and path == "/health":
+            return "200 OK", {"status": "ok"}
+        if method == "GET" and path == "/metrics":
+            return "200 OK", self.metrics.to_dict()
+        if method != "POST" or path != "/solve":
+            return "404 Not Found", {"error": f"No route for {method} {path}"}
+
+        start = time.perf_counter()
+        try:
+            request = json.loads(body)
+        except ValueError as e:
+            result = {"error": f"Invalid JSON: {e}"}
+        else:
+            if isinstance(request, dict):
+                result = await self.solve(request)
+            else:
+                result = {"error": "Invalid request: expected a JSON object"}
+        error = "error" in result
+        self.metrics.record(time.perf_counter() - start, error)
+        return ("400 Bad Request" if error else "200 OK"), result
+
+
+async def main(args):
+    """
+    Runs the service until interrupted.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+    """
+    server = SolveServer(
+        args.workers, args.batch_window / 1000, args.max_batch, args.timeout
+    )
+    listener = await server.start(args.host, args.port, args.unix)
+    where = args.unix or f"http://{args.host}:{args.port}"
+    print(f"Serving root finding on {where} with {server.workers} workers")
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Root-finding HTTP/JSON service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="Listen on this Unix socket path instead")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument(
+        "--batch-window", type=float, default=2.0, help="Batching window in ms"
+    )
+    parser.add_argument("--max-batch", type=int, default=64)
+    parser.add_argument(
+        "--timeout", type=float, default=10.0, help="Batch timeout in seconds"
+    )
+    try:
+        asyncio.run(main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
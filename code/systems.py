@@ -0,0 +1,434 @@
+"""
+Root-Finding Methods for Systems of Equations.
+
+This module provides multivariate root-finding methods for small nonlinear
+systems F(x) = 0 written as expressions over named variables.
+
+Jacobians are either given analytically as expressions or computed by finite
+differences in a single vectorized evaluation of the system at every
+perturbed point. The batched methods solve many independent systems at once
+with NumPy linear algebra.
+
+Classes:
+    SystemRootFinderMethods: Contains static methods for systems of equations.
+    SystemSolver: Handles the evaluation and solving of systems of equations.
+
+Functions:
+    compile_system: Compiles a list of expressions into a vector function.
+"""
+
+# Standard Library Imports
+import time
+
+# Third-Party Library Imports
+import numpy as np
+
+# Local Imports
+from functions import NUMPY_NAMESPACE, parse_expression
+from instrumentation import InstrumentedFunction, SolverMetrics
+
+
+def compile_system(exprs, variables, label="system"):
+    """
+    Compiles a list of expressions into a vector function of the variables.
+
+    The expressions are compiled into a single tuple expression, so one call
+    evaluates every component. The returned function takes an array whose
+    last axis holds the variables, in order, and returns an array whose last
+    axis holds the components. Leading axes are evaluated element-wise.
+
+    Args:
+        exprs (list): The component expressions, "^" is accepted for powers.
+        variables (list): The variable names.
+        label (str): How the system is named in error messages.
+
+    Returns:
+        callable: The compiled vector function.
+    """
+    for name in variables:
+        if not name.isidentifier() or name in NUMPY_NAMESPACE:
+            raise ValueError(f"Invalid variable name: {name}")
+    if len(set(variables)) != len(variables):
+        raise ValueError("Variable names must be unique.")
+    source = "(" + ", ".join(f"({expr})" for expr in exprs) + ",)"
+    code = parse_expression(
+        source, {*NUMPY_NAMESPACE, *variables}, label, expand_powers=True
+    )
+
+    def F(values):
+        values = np.asarray(values, dtype=float)
+        # Contiguous per-variable arrays keep the ufuncs off strided memory
+        columns = np.ascontiguousarray(np.moveaxis(values, -1, 0))
+        scope = dict(zip(variables, columns))
+        try:
+            with np.errstate(all="ignore"):
+                components = eval(
+                    code, {"__builtins__": {}, **NUMPY_NAMESPACE, **scope}
+                )
+        except Exception as e:
+            raise ValueError(f"Invalid {label}: {e}")
+        return np.stack(np.broadcast_arrays(*components, columns[0]), axis=-1)[
+            ..., :-1
+        ]
+
+    return F
+
+
+class SystemRootFinderMethods:
+    """
+    Contains static methods for finding roots of systems of equations.
+
+    Methods:
+        finite_difference_jacobian: Computes the Jacobian in one vectorized pass.
+        newton: Finds a root using the multivariate Newton method.
+        broyden: Finds a root using Broyden's quasi-Newton method.
+        batched_newton: Solves many independent systems at once.
+    """
+
+    @staticmethod
+    def finite_difference_jacobian(F, x, fx=None, h=1e-7):
+        """
+        Computes the Jacobian of a vector function by forward differences.
+
+        All n perturbed points are stacked and evaluated in a single call of
+        F, instead of n separate evaluations. Leading axes of `x` are treated
+        as independent systems.
+
+        Args:
+            F (callable): The vector function.
+            x (numpy.ndarray): The point(s), variables on the last axis.
+            fx (numpy.ndarray): F(x), if already known.
+            h (float): The relative step size.
+
+        Returns:
+            numpy.ndarray: The Jacobian(s), shaped (..., n, n).
+        """
+        n = x.shape[-1]
+        record = getattr(F, "record_derivative", None)
+        if record:
+            record(x.size // n)
+        if fx is None:
+            fx = F(x)
+        steps = h * np.maximum(1, np.abs(x))
+        # Row j of the stacked points is x perturbed along variable j
+        points = x[..., None, :] + np.eye(n) * steps[..., None, :]
+        differences = (F(points) - fx[..., None, :]) / steps[..., :, None]
+        return np.swapaxes(differences, -1, -2)
+
+    @staticmethod
+    def newton(F, x0, tol=1e-6, max_iter=100, jacobian=None):
+        """
+        Finds a root using the multivariate Newton method.
+
+        Args:
+            F (callable): The vector function to find the root of.
+            x0 (array_like): The initial guess.
+            tol (float): The tolerance for the max-norm of F(x).
+            max_iter (int): The maximum number of iterations.
+            jacobian (callable): The analytic Jacobian, finite differences
+                are used if omitted.
+
+        Returns:
+            tuple: The root and the number of iterations.
+        """
+        x = np.array(x0, dtype=float)
+        iterations = 0
+        fx = F(x)
+        # NaN compares as converged in the loop condition
+        if not np.all(np.isfinite(fx)):
+            raise ValueError("Newton iteration diverged.")
+        while np.max(np.abs(fx)) > tol and iterations < max_iter:
+            if jacobian:
+                J = jacobian(x)
+            else:
+                J = SystemRootFinderMethods.finite_difference_jacobian(F, x, fx)
+            try:
+                x = x - np.linalg.solve(J, fx)
+            except np.linalg.LinAlgError:
+                raise ValueError(
+                    "Jacobian is singular. Choose a better initial guess."
+                )
+            fx = F(x)
+            if not np.all(np.isfinite(fx)):
+                raise ValueError("Newton iteration diverged.")
+            iterations += 1
+        return x, iterations
+
+    @staticmethod
+    def broyden(F, x0, tol=1e-6, max_iter=100, jacobian=None):
+        """
+        Finds a root using Broyden's quasi-Newton method.
+
+        The Jacobian is computed once and then corrected by rank-one updates
+        from the observed change of F. It is recomputed only when a step fails
+        to reduce the residual.
+
+        Args:
+            F (callable): The vector function to find the root of.
+            x0 (array_like): The initial guess.
+            tol (float): The tolerance for the max-norm of F(x).
+            max_iter (int): The maximum number of iterations.
+            jacobian (callable): The analytic Jacobian, finite differences
+                are used if omitted.
+
+        Returns:
+            tuple: The root and the number of iterations.
+        """
+
+        def fresh_jacobian(x, fx):
+            if jacobian:
+                return jacobian(x)
+            return SystemRootFinderMethods.finite_difference_jacobian(F, x, fx)
+
+        record_fallback = getattr(F, "record_fallback", None)
+        x = np.array(x0, dtype=float)
+        iterations = 0
+        fx = F(x)
+        if not np.all(np.isfinite(fx)):
+            raise ValueError("Broyden iteration diverged.")
+        J = fresh_jacobian(x, fx)
+        while np.max(np.abs(fx)) > tol and iterations < max_iter:
+            try:
+                dx = -np.linalg.solve(J, fx)
+            except np.linalg.LinAlgError:
+                raise ValueError(
+                    "Jacobian is singular. Choose a better initial guess."
+                )
+            x_new = x + dx
+            f_new = F(x_new)
+            if not np.all(np.isfinite(f_new)):
+                raise ValueError("Broyden iteration diverged.")
+            if np.linalg.norm(f_new) < np.linalg.norm(fx):
+                J = J + np.outer(f_new - fx - J @ dx, dx) / (dx @ dx)
+            else:
+                if record_fallback:
+                    record_fallback("fresh Jacobian")
+                J = fresh_jacobian(x_new, f_new)
+            x, fx = x_new, f_new
+            iterations += 1
+        return x, iterations
+
+    @staticmethod
+    def batched_newton(
+        F, x0, tol=1e-6, max_iter=100, jacobian=None, broyden=False, bound=1e12
+    ):
+        """
+        Solves many independent systems at once.
+
+        Every row of `x0` is a system, iterated together with the others and
+        removed from the working set once it converges or fails. A system fails
+        when its Jacobian is singular or its iterate is NaN, infinite or beyond
+        `bound`.
+
+        Args:
+            F (callable): The vector function to find the roots of.
+            x0 (array_like): The initial guesses, shaped (m, n).
+            tol (float): The tolerance for the max-norm of F(x).
+            max_iter (int): The maximum number of iterations per system.
+            jacobian (callable): The analytic Jacobian, finite differences
+                are used if omitted.
+            broyden (bool): Whether to update the Jacobians with Broyden's
+                rank-one correction instead of recomputing them.
+            bound (float): Iterates larger than this in magnitude diverged.
+
+        Returns:
+            tuple: The final iterates, the iterations per system, and the mask
+                of converged systems.
+        """
+
+        def fresh_jacobian(x, fx):
+            if jacobian:
+                return jacobian(x)
+            return SystemRootFinderMethods.finite_difference_jacobian(F, x, fx)
+
+        record_fallback = getattr(F, "record_fallback", None)
+        x = np.array(x0, dtype=float)
+        iterations = np.zeros(len(x), dtype=int)
+        converged = np.zeros(len(x), dtype=bool)
+        lanes = np.arange(len(x))
+        fx = F(x)
+        J = fresh_jacobian(x, fx) if broyden else None
+        for step in range(max_iter + 1):
+            done = np.max(np.abs(fx), axis=-1) <= tol
+            converged[lanes[done]] = True
+            running = ~done & np.all(np.isfinite(fx), axis=-1)
+            if step == max_iter or not running.any():
+                break
+            lanes, fx = lanes[running], fx[running]
+            xa = x[lanes]
+            Ja = J[running] if broyden else fresh_jacobian(xa, fx)
+
+            dx = np.full_like(xa, np.nan)
+            # The sign of slogdet is 0 only for exactly singular Jacobians,
+            # the raw determinant underflows to 0 for larger systems
+            solvable = np.linalg.slogdet(Ja)[0] != 0
+            dx[solvable] = -np.linalg.solve(Ja[solvable], fx[solvable, :, None])[
+                ..., 0
+            ]
+            x_new = xa + dx
+            ok = np.all(np.isfinite(x_new) & (np.abs(x_new) <= bound), axis=-1)
+            lanes, xa, x_new, dx, fx, Ja = (
+                lanes[ok],
+                xa[ok],
+                x_new[ok],
+                dx[ok],
+                fx[ok],
+                Ja[ok],
+            )
+            f_new = F(x_new)
+            if broyden:
+                # Rank-one updates where the residual shrank, fresh Jacobians
+                # where it did not
+                improved = np.linalg.norm(f_new, axis=-1) < np.linalg.norm(fx, axis=-1)
+                correction = f_new - fx - np.einsum("kij,kj->ki", Ja, dx)
+                J = Ja + np.einsum("ki,kj->kij", correction, dx) / np.einsum(
+                    "kj,kj->k", dx, dx
+                )[:, None, None]
+                if not improved.all():
+                    if record_fallback:
+                        record_fallback("fresh Jacobian", int((~improved).sum()))
+                    J[~improved] = fresh_jacobian(x_new[~improved], f_new[~improved])
+            x[lanes] = x_new
+            iterations[lanes] += 1
+            fx = f_new
+        return x, iterations, converged
+
+
+class SystemSolver:
+    """
+    Handles the evaluation and solving of systems of equations.
+
+    Attributes:
+        finder (SystemRootFinderMethods): An instance of SystemRootFinderMethods.
+        metrics (SolverMetrics): Metrics accumulated over every solve.
+        last_metrics (SolverMetrics): Metrics of the last solve.
+    """
+
+    def __init__(self):
+        """
+        Initializes the SystemSolver.
+        """
+        self.finder = SystemRootFinderMethods()
+        self.metrics = SolverMetrics()
+        self.last_metrics = SolverMetrics()
+
+    def _compile(self, f_strs, variables, jacobian_strs, metrics):
+        """
+        Compiles the system and its optional analytic Jacobian.
+
+        Args:
+            f_strs (list): The component expressions.
+            variables (list): The variable names.
+            jacobian_strs (list): The Jacobian as rows of expressions, or None.
+            metrics (SolverMetrics): Where the evaluations are recorded.
+
+        Returns:
+            tuple: The instrumented system and the Jacobian function, or None.
+        """
+        if len(f_strs) != len(variables):
+            raise ValueError("The system must have as many equations as variables.")
+        F = InstrumentedFunction(
+            compile_system(f_strs, variables), metrics, point_size=len(variables)
+        )
+        if not jacobian_strs:
+            return F, None
+        n = len(variables)
+        if len(jacobian_strs) != n or any(len(row) != n for row in jacobian_strs):
+            raise ValueError(f"The Jacobian must be {n} x {n}.")
+        flat = compile_system(
+            [expr for row in jacobian_strs for expr in row], variables, "Jacobian"
+        )
+
+        def jacobian(x):
+            metrics.count("derivative_evaluations", np.size(x) // n)
+            return flat(x).reshape(*np.shape(x)[:-1], n, n)
+
+        return F, jacobian
+
+    def _finish_metrics(self, metrics, solve_time_ns, iterations):
+        """
+        Records the end of a solve and merges its metrics into the totals.
+
+        Args:
+            metrics (SolverMetrics): The metrics of the solve.
+            solve_time_ns (int): The time spent in the method itself.
+            iterations (int): The iterations taken.
+        """
+        metrics.count("solves")
+        metrics.add_time("solve_time_ns", solve_time_ns)
+        metrics.record_iterations(iterations)
+        self.metrics.merge(metrics)
+        metrics.emit("solve", metrics.to_dict())
+
+    def solve(
+        self, f_strs, variables, x0, tol, method_name="newton", jacobian_strs=None
+    ):
+        """
+        Solves a system of equations using the selected method.
+
+        Args:
+            f_strs (list): The component expressions.
+            variables (list): The variable names.
+            x0 (array_like): The initial guess.
+            tol (float): The tolerance for the max-norm of F(x).
+            method_name (str): "newton" or "broyden".
+            jacobian_strs (list): The Jacobian as rows of expressions, or None
+                for finite differences.
+
+        Returns:
+            tuple: The root, the number of iterations, and the computation time.
+        """
+        if method_name not in ["newton", "broyden"]:
+            raise ValueError(f"Invalid method selected: {method_name}")
+        metrics = self.last_metrics = SolverMetrics()
+        metrics.hooks = self.metrics.hooks
+        F, jacobian = self._compile(f_strs, variables, jacobian_strs, metrics)
+
+        start_time = time.perf_counter_ns()
+        root, iterations = getattr(self.finder, method_name)(
+            F, x0, tol, jacobian=jacobian
+        )
+        solve_time_ns = time.perf_counter_ns() - start_time
+        self._finish_metrics(metrics, solve_time_ns, iterations)
+        return root, iterations, solve_time_ns / 1e9
+
+    def solve_batch(
+        self,
+        f_strs,
+        variables,
+        x0,
+        tol,
+        method_name="newton",
+        jacobian_strs=None,
+        max_iter=100,
+    ):
+        """
+        Solves many independent instances of a system at once.
+
+        Args:
+            f_strs (list): The component expressions.
+            variables (list): The variable names.
+            x0 (array_like): The initial guesses, shaped (m, n).
+            tol (float): The tolerance for the max-norm of F(x).
+            method_name (str): "newton" or "broyden".
+            jacobian_strs (list): The Jacobian as rows of expressions, or None
+                for finite differences.
+            max_iter (int): The maximum number of iterations per system.
+
+        Returns:
+            tuple: The final iterates, the iterations per system, the mask of
+                converged systems, and the computation time.
+        """
+        if method_name not in ["newton", "broyden"]:
+            raise ValueError(f"Invalid method selected: {method_name}")
+        metrics = self.last_metrics = SolverMetrics()
+        metrics.hooks = self.metrics.hooks
+        F, jacobian = self._compile(f_strs, variables, jacobian_strs, metrics)
+
+        start_time = time.perf_counter_ns()
+        roots, iterations, converged = self.finder.batched_newton(
+            F, x0, tol, max_iter, jacobian, broyden=method_name == "broyden"
+        )
+        solve_time_ns = time.perf_counter_ns() - start_time
+        self._finish_metrics(metrics, solve_time_ns, iterations.sum())
+        return roots, iterations, converged, solve_time_ns / 1e9
@@ -23,7 +23,7 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import pyperclip
 
 # Local Imports
-from functions import FunctionSolver, RootFinderMethods
+from functions import FIXED_POINT_ACCELERATIONS, FunctionSolver, RootFinderMethods
 
 
 class RootFinderUI:
@@ -42,6 +42,13 @@ class RootFinderUI:
         tol_entry (ttk.Entry): Input field for the tolerance.
         method_var (ttk.StringVar): Stores the selected method.
         method_combobox (ttk.Combobox): Dropdown for selecting the method.
+        acceleration_var (ttk.StringVar): Stores the selected fixed-point acceleration.
+        acceleration_combobox (ttk.Combobox): Dropdown for selecting the acceleration.
+        depth_entry (ttk.Entry): Input field for the Anderson history depth.
+        map_var (ttk.BooleanVar): Whether to draw the convergence map.
+        map_check (ttk.Checkbutton): Toggles the convergence map.
+        map_starts_entry (ttk.Entry): Input field for the number of map starts.
+        map_processes_entry (ttk.Entry): Input field for the map worker processes.
         solve_button (ttk.Button): Button to trigger the solve operation.
         close_button (ttk.Button): Button to close the application.
         save_button (ttk.Button): Button to save the plot.
@@ -116,6 +123,42 @@ class RootFinderUI:
             values=list(self.methods.keys()),
         )
         self.method_combobox.grid(row=4, column=1, padx=5, pady=5, columnspan=3)
+
+        ttk.Label(input_frame, text="Acceleration / Anderson Depth:").grid(
+            row=5, column=0, sticky="w", padx=5, pady=5
+        )
+        self.accelerations = {
+            (mode or "none").title(): mode for mode in FIXED_POINT_ACCELERATIONS
+        }
+        self.acceleration_var = ttk.StringVar()
+        self.acceleration_combobox = ttk.Combobox(
+            input_frame,
+            textvariable=self.acceleration_var,
+            values=list(self.accelerations.keys()),
+        )
+        self.acceleration_combobox.grid(
+            row=5, column=1, padx=5, pady=5, columnspan=2, sticky="ew"
+        )
+        self.acceleration_combobox.current(0)
+        self.depth_entry = ttk.Entry(input_frame, width=10)
+        self.depth_entry.grid(row=5, column=3, padx=5, pady=5)
+        self.depth_entry.insert(0, "1")
+
+        self.map_var = ttk.BooleanVar(value=False)
+        self.map_check = ttk.Checkbutton(
+            input_frame,
+            text="Convergence Map (starts / processes):",
+            variable=self.map_var,
+        )
+        self.map_check.grid(row=6, column=0, sticky="w", padx=5, pady=5)
+        self.map_starts_entry = ttk.Entry(input_frame, width=10)
+        self.map_starts_entry.grid(row=6, column=1, padx=5, pady=5)
+        self.map_starts_entry.insert(0, "100000")
+        self.map_processes_entry = ttk.Entry(input_frame, width=10)
+        self.map_processes_entry.grid(row=6, column=2, padx=5, pady=5)
+        self.map_processes_entry.insert(0, "1")
+
+        # Selecting the default method disables the fixed-point only fields
         self.method_combobox.current(0)
 
         for i in range(5):
@@ -124,7 +167,7 @@ class RootFinderUI:
         self.solve_button = ttk.Button(
             input_frame, text="Solve", command=self.solve, bootstyle=PRIMARY, width=15
         )
-        self.solve_button.grid(row=5, column=0, padx=5, pady=10, sticky="ew")
+        self.solve_button.grid(row=7, column=0, padx=5, pady=10, sticky="ew")
 
         self.close_button = ttk.Button(
             input_frame,
@@ -133,7 +176,7 @@ class RootFinderUI:
             bootstyle=DANGER,
             width=15,
         )
-        self.close_button.grid(row=5, column=1, padx=5, pady=10, sticky="ew")
+        self.close_button.grid(row=7, column=1, padx=5, pady=10, sticky="ew")
 
         self.save_button = ttk.Button(
             input_frame,
@@ -143,7 +186,7 @@ class RootFinderUI:
             state=DISABLED,
             width=15,
         )
-        self.save_button.grid(row=5, column=2, padx=5, pady=10, sticky="ew")
+        self.save_button.grid(row=7, column=2, padx=5, pady=10, sticky="ew")
 
         self.theme_button = ttk.Button(
             input_frame,
@@ -152,7 +195,7 @@ class RootFinderUI:
             bootstyle=INFO,
             width=15,
         )
-        self.theme_button.grid(row=5, column=3, padx=5, pady=10, sticky="ew")
+        self.theme_button.grid(row=7, column=3, padx=5, pady=10, sticky="ew")
 
         output_frame = ttk.LabelFrame(root, text="Output", padding=10)
         output_frame.pack(fill=X, padx=10, pady=10)
@@ -179,7 +222,7 @@ class RootFinderUI:
             dict: A dictionary mapping display names to method names.
         """
         methods = {}
-        blacklist = ["numerical_derivative"]
+        blacklist = ["numerical_derivative", "safeguarded_newton"]
         for name, method in RootFinderMethods.__dict__.items():
             if isinstance(method, staticmethod) and name not in blacklist:
                 display_name = name.replace("_", " ").title()
@@ -193,8 +236,12 @@ class RootFinderUI:
         method_display_name = self.method_var.get()
         if method_display_name == "Fixed Point":
             self.g_entry.config(state=NORMAL)
+            self.acceleration_combobox.config(state="readonly")
+            self.depth_entry.config(state=NORMAL)
         else:
             self.g_entry.config(state=DISABLED)
+            self.acceleration_combobox.config(state=DISABLED)
+            self.depth_entry.config(state=DISABLED)
 
     def save_to_csv(self, method, function, iterations, interval, root, comp_time):
         file_exists = os.path.isfile("results.csv")
@@ -234,20 +281,44 @@ class RootFinderUI:
                 g_str = self.g_entry.get()
                 if not g_str:
                     raise ValueError("g(x) is required for Fixed-Point Iteration.")
+                acceleration = self.accelerations.get(self.acceleration_var.get())
+                depth = int(self.depth_entry.get())
             else:
                 g_str = None
+                acceleration = None
+                depth = 1
 
             root, iterations, computation_time = self.function_solver.solve(
-                f_str, a, b, tol, method_name, g_str
+                f_str, a, b, tol, method_name, g_str, acceleration, depth
             )
 
             if root is not None:
                 result_text = f"Root: {root:.6f}\nIterations: {iterations}\nComputation Time: {computation_time:.6f} seconds"
+                steps = self.function_solver.last_steps
+                if steps:
+                    counts = {step: steps.count(step) for step in dict.fromkeys(steps)}
+                    result_text += "\nSteps: " + ", ".join(
+                        f"{step} x{count}" for step, count in counts.items()
+                    )
                 self.result_label.config(text=result_text)
             else:
                 self.result_label.config(text="No root found.")
 
             self.plot_manager.update_plot(f_str, a, b, root, method_display_name)
+            if self.map_var.get() and method_name in ["newton_raphson", "secant"]:
+                self.plot_manager.update_convergence_map(
+                    *self.function_solver.convergence_map(
+                        f_str,
+                        a,
+                        b,
+                        method_name,
+                        n=int(self.map_starts_entry.get()),
+                        tol=tol,
+                        processes=int(self.map_processes_entry.get()),
+                    )
+                )
+            else:
+                self.plot_manager.hide_convergence_map()
 
             interval = f"[{a}, {b}]"
             self.save_to_csv(
@@ -285,6 +356,8 @@ class PlotManager:
         theme_manager (ThemeManager): Manages the application's theme.
         fig (matplotlib.figure.Figure): The figure for the plot.
         ax (matplotlib.axes.Axes): The axes for the plot.
+        map_ax (matplotlib.axes.Axes): The axes for the convergence map strip,
+            None while the map is hidden.
         canvas (FigureCanvasTkAgg): The canvas for embedding the plot in the UI.
     """
 
@@ -298,6 +371,7 @@ class PlotManager:
         """
         self.theme_manager = theme_manager
         self.fig, self.ax = plt.subplots()
+        self.map_ax = None
         self.canvas = FigureCanvasTkAgg(self.fig, master=root)
         self.canvas.get_tk_widget().pack(fill=BOTH, expand=YES)
         self.update_plot_colors()
@@ -335,6 +409,71 @@ class PlotManager:
         self.fig.patch.set_facecolor(colors["bg"])
         self.canvas.draw()
 
+    def update_convergence_map(self, starts, labels, iterations, roots):
+        """
+        Draws the convergence map strip under the main plot.
+
+        Each starting point is colored by the root it converged to and shaded
+        by how many iterations it took, brighter meaning faster. The nine roots
+        reached from most starts get their own colors, the rest are gray and
+        starts that did not converge are left black.
+
+        Args:
+            starts (numpy.ndarray): The evenly spaced starting points.
+            labels (numpy.ndarray): The root index per start, -1 if none.
+            iterations (numpy.ndarray): The iterations per start.
+            roots (numpy.ndarray): The distinct roots found.
+        """
+        if self.map_ax is None:
+            # Give the strip its own row only while the map is shown
+            grid = self.fig.add_gridspec(2, 1, height_ratios=[8, 1])
+            self.ax.set_subplotspec(grid[0])
+            self.map_ax = self.fig.add_subplot(grid[1], sharex=self.ax)
+            self.update_plot_colors()
+        self.map_ax.clear()
+        palette = plt.get_cmap("tab10")(np.arange(10))[:, :3]
+        palette = np.vstack([np.delete(palette, 7, axis=0), palette[7]])
+        counts = np.bincount(labels[labels >= 0], minlength=len(roots))
+        rank = np.empty(len(roots), dtype=int)
+        rank[np.argsort(-counts, kind="stable")] = np.arange(len(roots))
+        rank = np.minimum(rank, len(palette) - 1)
+        shade = 1 - 0.7 * iterations / max(iterations.max(), 1)
+        if roots.size:
+            image = palette[rank[np.where(labels >= 0, labels, 0)]] * shade[:, None]
+        else:
+            image = np.zeros((len(labels), 3))
+        image[labels < 0] = 0
+        colors = self.theme_manager.get_colors()
+        # The axes share x, so keep the range update_plot widened for the root
+        xlim = self.ax.get_xlim()
+        self.map_ax.imshow(
+            image[None, :, :],
+            aspect="auto",
+            extent=(starts[0], starts[-1], 0, 1),
+            interpolation="nearest",
+        )
+        self.ax.set_xlim(xlim)
+        self.map_ax.set_yticks([])
+        self.map_ax.set_xlabel("Initial guess", color=colors["fg"])
+        self.map_ax.tick_params(axis="x", colors=colors["fg"])
+        self.ax.xaxis.label.set_visible(False)
+        for index, root in enumerate(roots):
+            if rank[index] < len(palette) - 1 and starts[0] <= root <= starts[-1]:
+                self.ax.axvline(root, color=palette[rank[index]], linestyle=":")
+        self.canvas.draw()
+
+    def hide_convergence_map(self):
+        """
+        Hides the convergence map strip, giving its space back to the plot.
+        """
+        if self.map_ax is None:
+            return
+        self.map_ax.remove()
+        self.map_ax = None
+        self.ax.set_subplotspec(self.fig.add_gridspec(1, 1)[0])
+        self.ax.xaxis.label.set_visible(True)
+        self.canvas.draw()
+
     def save_plot(self):
         """
         Saves the current plot to a file.
@@ -382,6 +521,11 @@ class PlotManager:
         self.fig.patch.set_facecolor(colors["bg"])
         for spine in self.ax.spines.values():
             spine.set_edgecolor(colors["fg"])
+        if self.map_ax is not None:
+            for spine in self.map_ax.spines.values():
+                spine.set_edgecolor(colors["fg"])
+            self.map_ax.xaxis.label.set_color(colors["fg"])
+            self.map_ax.tick_params(axis="x", colors=colors["fg"])
         self.ax.xaxis.label.set_color(colors["fg"])
         self.ax.yaxis.label.set_color(colors["fg"])
         self.ax.title.set_color(colors["fg"])